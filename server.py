@@ -14,17 +14,26 @@ Supports:
 
 import os
 import re
+import atexit
+import asyncio
 import copy
-from difflib import SequenceMatcher
+import zipfile
+from functools import lru_cache, wraps
+from itertools import islice
+from collections import OrderedDict
+from typing import NamedTuple
+from lxml import etree
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor, Twips, Cm
 from docx.table import Table
+from docx.text.paragraph import Paragraph
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK, WD_LINE_SPACING
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.section import WD_ORIENT, WD_SECTION
 from docx.oxml.ns import qn, nsmap
 from docx.oxml import OxmlElement
 from fastmcp import FastMCP
+from rapidfuzz import fuzz, process
 
 # Define the default document path (now in documents/ folder)
 DEFAULT_DOCX_PATH = os.environ.get("DOCX_PATH", os.path.join("documents", "MCP.docx"))
@@ -32,57 +41,626 @@ DEFAULT_DOCX_PATH = os.environ.get("DOCX_PATH", os.path.join("documents", "MCP.d
 # Global variable to track current active document
 CURRENT_DOCX_PATH = DEFAULT_DOCX_PATH
 
+# Seconds to wait after the last edit before writing the document to disk
+SAVE_DELAY = float(os.environ.get("DOCX_SAVE_DELAY", "0.2"))
+
+# In-memory copy of the active document and its pending-save state
+# save_error holds the last failed write until it is reported in a tool result
+_DOC_STATE = {"path": None, "doc": None, "dirty": False, "save_handle": None, "autosave": True, "save_error": None}
+
+# Recently loaded documents: path -> (file signature, Document), least recently used first
+_DOC_CACHE = OrderedDict()
+_DOC_CACHE_SIZE = 8
+
+# Directory listings used by walk_docx_files: path -> (mtime_ns, subdirectories, .docx files)
+_DIR_LISTING_CACHE = {}
+_DIR_LISTING_CACHE_SIZE = 4096
+
+# Placeholder syntax: <<Name>> or {{Name}}
+_PLACEHOLDER_RE = re.compile(r'(<<[^<>]+>>|\{\{[^{}]+\}\})')
+
+# Markdown table cell (the text between two pipes) and separator cell (---, :--:)
+_MD_CELL_RE = re.compile(r'\|([^|]*)(?=\|)')
+_CELL_SEP_RE = re.compile(r'^[\s\-:]+$')
+
+# Longest table text whose parse is cached by detect_table_format
+_TABLE_PARSE_CACHE_MAX_TEXT = 50_000
+
+# Paragraph alignment names accepted by the formatting tools
+_ALIGNMENT_MAP = {
+    "left": WD_ALIGN_PARAGRAPH.LEFT,
+    "center": WD_ALIGN_PARAGRAPH.CENTER,
+    "right": WD_ALIGN_PARAGRAPH.RIGHT,
+    "justify": WD_ALIGN_PARAGRAPH.JUSTIFY
+}
+
+# Style type names accepted by get_styles
+_STYLE_TYPE_MAP = {
+    "paragraph": WD_STYLE_TYPE.PARAGRAPH,
+    "character": WD_STYLE_TYPE.CHARACTER,
+    "table": WD_STYLE_TYPE.TABLE,
+    "list": WD_STYLE_TYPE.LIST
+}
+
+# Characters not allowed in bookmark names
+_BOOKMARK_INVALID_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+# Whitespace skipped after a split point (see split_paragraph)
+_LEADING_WHITESPACE_RE = re.compile(r'\s*')
+
+# Paragraph index of the last document scanned (see get_paragraph_index)
+_PARAGRAPH_INDEX = {"doc": None, "index": None}
+
+# Placeholder scan of the last document scanned (see find_placeholders)
+_PLACEHOLDER_SCAN = {"doc": None, "max_details": None, "result": None}
+
+# Streamed paragraph texts of the last document read from disk (see get_paragraph_texts)
+_PARAGRAPH_TEXTS = {"path": None, "signature": None, "raw": None, "stripped": None}
+
+# Number of direct runs of a <w:p> that contain an image (used by get_document_stats)
+_IMAGE_RUN_COUNT_XPATH = etree.XPath('count(./w:r[.//a:blip])', namespaces=nsmap)
+
+# Bookmarks and hyperlinks inside body paragraphs (used by the bookmark and hyperlink tools)
+_PARAGRAPH_BOOKMARK_START_XPATH = etree.XPath('./w:p//w:bookmarkStart', namespaces=nsmap)
+_PARAGRAPH_BOOKMARK_END_XPATH = etree.XPath('./w:p//w:bookmarkEnd', namespaces=nsmap)
+_PARAGRAPH_HYPERLINK_XPATH = etree.XPath('./w:p//w:hyperlink', namespaces=nsmap)
+
+# Text nodes of a paragraph's runs, including runs inside hyperlinks (used by replace_text_in_paragraph)
+_PARAGRAPH_TEXT_NODES_XPATH = etree.XPath('./w:r/w:t | ./w:hyperlink/w:r/w:t', namespaces=nsmap)
+
+# The n-th (1-based) cell of every row of a <w:tbl> (used by delete_table_column)
+_TABLE_NTH_CELLS_XPATH = etree.XPath('./w:tr/w:tc[$n]', namespaces=nsmap)
+
+# Text equivalents of run content, matching python-docx's Run.text (used by iter_paragraph_texts)
+_RUN_TEXT_TAGS = {
+    qn('w:tab'): '\t',
+    qn('w:ptab'): '\t',
+    qn('w:cr'): '\n',
+    qn('w:noBreakHyphen'): '-',
+}
+
 
 # Create the MCP server
 mcp = FastMCP(name="Docx Editor")
 
 
+def file_signature(path: str):
+    """Return (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def get_cached_document():
+    """
+    Return the active document if an up-to-date copy is already in memory, else None.
+    A cached copy is reused only while the file on disk is unchanged (same mtime and size).
+    """
+    path = CURRENT_DOCX_PATH
+    if _DOC_STATE["dirty"] and _DOC_STATE["path"] == path:
+        # Unsaved edits are newer than the file on disk
+        return _DOC_STATE["doc"]
+
+    cached = _DOC_CACHE.get(path)
+    if cached is not None and cached[0] == file_signature(path):
+        return cached[1]
+    return None
+
+
 def get_document():
-    """Helper to load the document or create a new one if it doesn't exist."""
+    """
+    Helper to load the document or create a new one if it doesn't exist.
+    Loaded documents are cached in memory and reused until the file changes on disk.
+    """
     global CURRENT_DOCX_PATH
-    if os.path.exists(CURRENT_DOCX_PATH):
-        return Document(CURRENT_DOCX_PATH)
-    return Document()
+    path = CURRENT_DOCX_PATH
+
+    # Switching documents: write out any pending edits of the previous one first
+    if _DOC_STATE["path"] != path:
+        flush_pending_save()
+
+    doc = get_cached_document()
+    if doc is None:
+        # Open once instead of checking existence first
+        try:
+            with open(path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                signature = (st.st_mtime_ns, st.st_size)
+                doc = Document(f)
+        except FileNotFoundError:
+            signature = None
+            doc = Document()
+        _DOC_CACHE[path] = (signature, doc)
+
+    _DOC_CACHE.move_to_end(path)
+    while len(_DOC_CACHE) > _DOC_CACHE_SIZE:
+        _DOC_CACHE.popitem(last=False)
+
+    _DOC_STATE["path"] = path
+    _DOC_STATE["doc"] = doc
+    return doc
+
+
+def clear_derived_caches():
+    """Forget the paragraph index and placeholder scan, e.g. after the document changed."""
+    _PARAGRAPH_INDEX["doc"] = None
+    _PARAGRAPH_INDEX["index"] = None
+    _PLACEHOLDER_SCAN["doc"] = None
+    _PLACEHOLDER_SCAN["result"] = None
 
 
 def save_document(doc):
-    """Save document to the current active path."""
+    """
+    Mark the document as modified and schedule a save to the current active path.
+    The save is debounced by SAVE_DELAY seconds so a burst of edits is written to disk once.
+    With autosave off (see set_autosave), nothing is written until the document is flushed.
+    """
     global CURRENT_DOCX_PATH
-    doc.save(CURRENT_DOCX_PATH)
+    _DOC_STATE["path"] = CURRENT_DOCX_PATH
+    _DOC_STATE["doc"] = doc
+    _DOC_STATE["dirty"] = True
+
+    # The document was edited, so any cached paragraph index or placeholder scan is stale
+    clear_derived_caches()
+
+    if not _DOC_STATE["autosave"]:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Not called from a tool (no event loop), so save right away
+        flush_pending_save()
+        return
+
+    if _DOC_STATE["save_handle"] is not None:
+        _DOC_STATE["save_handle"].cancel()
+    _DOC_STATE["save_handle"] = loop.call_later(SAVE_DELAY, deferred_save)
 
 
-def find_document_by_name(query: str, search_dir: str = ".") -> list:
+def flush_pending_save():
+    """Write the in-memory document to disk now if it has unsaved changes."""
+    if _DOC_STATE["save_handle"] is not None:
+        _DOC_STATE["save_handle"].cancel()
+        _DOC_STATE["save_handle"] = None
+
+    if _DOC_STATE["dirty"]:
+        path = _DOC_STATE["path"]
+        try:
+            _DOC_STATE["doc"].save(path)
+        except Exception as e:
+            # The edits stay in memory (still dirty) so a later save can retry
+            _DOC_STATE["save_error"] = f"Could not save '{path}': {type(e).__name__}: {e}"
+            raise
+        _DOC_STATE["dirty"] = False
+        _DOC_STATE["save_error"] = None
+        # Our own write must not invalidate the cached copy
+        _DOC_CACHE[path] = (file_signature(path), _DOC_STATE["doc"])
+
+
+def deferred_save():
     """
-    Find .docx files by fuzzy name matching in the specified directory.
-    Returns list of (file_path, filename, score) tuples sorted by score.
+    Run the debounced save scheduled by save_document().
+    The tool that made the edits has already returned, so a failed write is kept in
+    _DOC_STATE["save_error"] and reported by the next editing tool instead of being lost.
     """
-    results = []
+    _DOC_STATE["save_handle"] = None
+    try:
+        flush_pending_save()
+    except Exception:
+        pass
 
-    # Walk through directory to find all .docx files
-    for root, dirs, files in os.walk(search_dir):
-        for file in files:
-            if file.endswith('.docx') and not file.startswith('~$'):  # Skip temp files
-                file_path = os.path.join(root, file)
-                filename = os.path.splitext(file)[0]  # Remove .docx extension
 
-                # Calculate similarity
-                score = similarity(query.lower(), filename.lower())
+# Never lose pending edits when the server shuts down
+atexit.register(flush_pending_save)
 
-                # Also check if query is contained in filename
-                if query.lower() in filename.lower():
-                    score = max(score, 0.8)
 
-                if score >= 0.3:  # Minimum threshold
-                    results.append((file_path, file, score))
+def discard_active_document():
+    """
+    Drop the in-memory copy of the active document without saving it.
+    The next tool call re-reads the file, so edits that were never saved are lost.
+    Everything derived from the dropped copy (cache entry, paragraph index, placeholder scan) goes too.
+    """
+    if _DOC_STATE["save_handle"] is not None:
+        _DOC_STATE["save_handle"].cancel()
+        _DOC_STATE["save_handle"] = None
+    _DOC_CACHE.pop(CURRENT_DOCX_PATH, None)
+    if _DOC_STATE["path"] is not None:
+        _DOC_CACHE.pop(_DOC_STATE["path"], None)
+    _DOC_STATE["path"] = None
+    _DOC_STATE["doc"] = None
+    _DOC_STATE["dirty"] = False
+
+    clear_derived_caches()
+
+
+def editing_tool(func):
+    """
+    Decorator for tools that edit the active document.
+    A tool that fails partway through must not leave half-applied edits in memory for the
+    next save to write out. Without unsaved edits the in-memory copy is simply dropped, so the
+    next call re-reads the file. With unsaved edits (autosave pending or off), the document body
+    is copied before the tool runs and put back if it raises; nothing is written or serialised,
+    so a burst of edits is still saved once.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        snapshot = None
+        if _DOC_STATE["dirty"] and _DOC_STATE["path"] == CURRENT_DOCX_PATH:
+            doc = _DOC_STATE["doc"]
+            snapshot = (doc, copy.deepcopy(doc.element.body))
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException:
+            if snapshot is None:
+                discard_active_document()
+            else:
+                # Put the saved body children back; the Document and its cache entry stay the same
+                doc, body = snapshot
+                doc.element.body[:] = list(body)
+                clear_derived_caches()
+            raise
+
+        # Report a background save that failed since the last tool call
+        save_error = _DOC_STATE["save_error"]
+        if save_error is not None and isinstance(result, dict):
+            _DOC_STATE["save_error"] = None
+            result["save_error"] = f"{save_error}. The edits are kept in memory and saving will be retried."
+        return result
+    return wrapper
+
+
+class ParagraphIndex(NamedTuple):
+    """Snapshot of a document's body paragraphs, built once by get_paragraph_index()."""
+    paragraphs: list  # Paragraph objects, in document order
+    texts: list       # Stripped paragraph text
+    lowers: list      # Lowercased stripped text
+    styles: list      # Paragraph style name (or None)
+    headings: list    # (paragraph index, heading level or None) for "Heading*" styles
+
+
+def parse_heading_level(style_name: str):
+    """Extract the level from a heading style name (e.g., "Heading 2" -> 2), or None."""
+    try:
+        return int(style_name.replace('Heading ', ''))
+    except ValueError:
+        return None
+
+
+def get_paragraph_index(doc) -> ParagraphIndex:
+    """
+    Get the ParagraphIndex for a document, built in a single pass once per document.
+    Tools scan this index instead of re-walking the XML for text, case-folding and style lookups.
+    """
+    if _PARAGRAPH_INDEX["doc"] is not doc:
+        paragraphs = doc.paragraphs
+        texts = []
+        styles = []
+        headings = []
+        style_names = {}  # style id -> style name, so each style is resolved once
+
+        for idx, para in enumerate(paragraphs):
+            # Read the text straight from the XML; much cheaper than Paragraph.text
+            texts.append(paragraph_xml_text(para._p).strip())
+
+            style_id = para._p.style
+            if style_id not in style_names:
+                style = para.style
+                style_names[style_id] = style.name if style else None
+            style_name = style_names[style_id]
+            styles.append(style_name)
+
+            if style_name and style_name.startswith('Heading'):
+                headings.append((idx, parse_heading_level(style_name)))
+
+        _PARAGRAPH_INDEX["doc"] = doc
+        _PARAGRAPH_INDEX["index"] = ParagraphIndex(
+            paragraphs, texts, [text.lower() for text in texts], styles, headings
+        )
+    return _PARAGRAPH_INDEX["index"]
+
+
+def get_paragraph_by_index(doc, idx: int):
+    """
+    Get the body paragraph at idx, or None if there is none.
+    Uses the paragraph index if it is already built; otherwise only the <w:p> elements up to idx
+    are walked, so a single lookup doesn't rebuild the whole index after every edit.
+    """
+    if idx < 0:
+        return None
+    if _PARAGRAPH_INDEX["doc"] is doc:
+        paragraphs = _PARAGRAPH_INDEX["index"].paragraphs
+        return paragraphs[idx] if idx < len(paragraphs) else None
+    p = next(islice(doc.element.body.iterchildren(qn('w:p')), idx, None), None)
+    return Paragraph(p, doc._body) if p is not None else None
+
+
+def paragraph_xml_text(p) -> str:
+    """Get the text of a raw <w:p> element the same way python-docx's Paragraph.text does."""
+    parts = []
+    for child in p:
+        if child.tag == qn('w:r'):
+            runs = (child,)
+        elif child.tag == qn('w:hyperlink'):
+            runs = child.iterchildren(qn('w:r'))
+        else:
+            continue
+
+        for run in runs:
+            for elem in run:
+                parts.append(run_content_text(elem))
+    return ''.join(parts)
+
+
+def run_content_text(elem) -> str:
+    """Get the text equivalent of one child element of a <w:r> (empty for properties, drawings, etc.)."""
+    if elem.tag == qn('w:t'):
+        return elem.text or ''
+    if elem.tag == qn('w:br'):
+        # Page and column breaks have no text equivalent
+        return '\n' if elem.get(qn('w:type'), 'textWrapping') == 'textWrapping' else ''
+    return _RUN_TEXT_TAGS.get(elem.tag, '')
+
+
+def split_run(r, offset: int):
+    """
+    Split a <w:r> in two at a text offset, keeping its formatting on both halves.
+    The second half is inserted right after r and returned.
+    """
+    new_r = OxmlElement('w:r', dict(r.attrib))
+    if r.rPr is not None:
+        new_r.append(copy.deepcopy(r.rPr))
+
+    pos = 0
+    moving = False
+    for elem in list(r):
+        if elem.tag == qn('w:rPr'):
+            continue
+        if moving:
+            new_r.append(elem)
+            continue
+
+        text = run_content_text(elem)
+        if pos + len(text) <= offset:
+            pos += len(text)
+            moving = pos == offset
+            continue
+
+        # Only a <w:t> can straddle the offset: keep its head here and move its tail
+        head, tail = text[:offset - pos], text[offset - pos:]
+        elem.text = head
+        new_t = OxmlElement('w:t')
+        new_t.text = tail
+        for t in (elem, new_t):
+            if t.text and (t.text[0].isspace() or t.text[-1].isspace()):
+                t.set(qn('xml:space'), 'preserve')
+        new_r.append(new_t)
+        moving = True
+
+    r.addnext(new_r)
+    return new_r
+
+
+def split_paragraph_content(p, offset: int) -> int:
+    """
+    Make sure a content boundary of a <w:p> (or <w:hyperlink>) falls at the given text offset,
+    splitting a run, or a hyperlink into two links to the same target, if needed.
+    Returns the position in p of the first child after the offset.
+    """
+    pos = 0
+    for i, child in enumerate(p):
+        if child.tag == qn('w:pPr'):
+            continue
+        if pos == offset:
+            return i
+
+        # Only runs and hyperlinks contribute to the paragraph text
+        length = len(paragraph_xml_text([child]))
+        if pos < offset < pos + length:
+            if child.tag == qn('w:r'):
+                split_run(child, offset - pos)
+            else:
+                j = split_paragraph_content(child, offset - pos)
+                new_hyperlink = OxmlElement('w:hyperlink', dict(child.attrib))
+                new_hyperlink.extend(child[j:])
+                child.addnext(new_hyperlink)
+            return i + 1
+        pos += length
+
+    return len(p)
+
+
+def body_child_of(element, body):
+    """Return the direct child of body (e.g. the body paragraph) that contains element."""
+    parent = element.getparent()
+    while parent is not body:
+        element, parent = parent, parent.getparent()
+    return element
+
+
+def iter_table_cells(doc):
+    """
+    Yield (table_index, row, column, tc) for every cell of the document's body tables.
+    Walks the raw XML, so a merged cell is visited once at its grid position
+    (python-docx's row.cells repeats merged cells for every column they span).
+    """
+    for table_idx, tbl in enumerate(doc.element.body.iterchildren(qn('w:tbl'))):
+        for row_idx, tr in enumerate(tbl.tr_lst):
+            col_idx = tr.grid_before
+            for tc in tr.tc_lst:
+                yield table_idx, row_idx, col_idx, tc
+                col_idx += tc.grid_span
+
+
+def table_text_grid(tbl) -> list[list[str]]:
+    """
+    Read the stripped text of every cell of a raw <w:tbl> in one pass, without cell objects.
+    Rows are laid out like python-docx's row.cells: a horizontally merged cell is repeated for
+    each column it spans and a vertically merged cell repeats the text of the cell it continues.
+    """
+    grid = []
+    above = {}  # grid offset -> (text, span) of the cell starting there in the previous row
+    for tr in tbl.tr_lst:
+        row = []
+        current = {}
+        col_idx = tr.grid_before
+        for tc in tr.tc_lst:
+            if tc.vMerge == 'continue':
+                # Continues the cell above, which supplies both text and width
+                text, span = above.get(col_idx, ('', tc.grid_span))
+            else:
+                text, span = cell_xml_text(tc).strip(), tc.grid_span
+            row.extend([text] * span)
+            current[col_idx] = (text, span)
+            col_idx += tc.grid_span
+        grid.append(row)
+        above = current
+    return grid
+
+
+def cell_xml_text(tc) -> str:
+    """Get the text of a raw <w:tc> element the same way python-docx's _Cell.text does."""
+    return '\n'.join(paragraph_xml_text(p) for p in tc.iterchildren(qn('w:p')))
+
+
+def iter_paragraph_texts(path: str):
+    """
+    Stream the text of each body paragraph of a .docx file, in document order.
+    Parses word/document.xml incrementally and frees each body element once read,
+    so memory stays flat regardless of document size.
+    """
+    body_tag = qn('w:body')
+    with zipfile.ZipFile(path) as archive, archive.open('word/document.xml') as xml:
+        for _, elem in etree.iterparse(xml, events=('end',), resolve_entities=False):
+            parent = elem.getparent()
+            if parent is None or parent.tag != body_tag:
+                continue
+
+            if elem.tag == qn('w:p'):
+                yield paragraph_xml_text(elem)
+
+            # Drop the finished element and everything before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+def get_paragraph_texts(strip: bool = True) -> list:
+    """
+    Get the text of every body paragraph of the active document, for read-only tools.
+    Uses the cached document if it is up to date, otherwise streams the file from disk
+    without building a Document. Streamed texts are kept until the file changes.
+    """
+    doc = get_cached_document()
+    if doc is None:
+        path = CURRENT_DOCX_PATH
+        signature = file_signature(path)
+        if signature is None or _PARAGRAPH_TEXTS["path"] != path or _PARAGRAPH_TEXTS["signature"] != signature:
+            try:
+                texts = list(iter_paragraph_texts(path))
+            except FileNotFoundError:
+                texts = None
+            _PARAGRAPH_TEXTS["path"] = path
+            _PARAGRAPH_TEXTS["signature"] = signature
+            _PARAGRAPH_TEXTS["raw"] = texts
+            _PARAGRAPH_TEXTS["stripped"] = None if texts is None else [text.strip() for text in texts]
+
+        if _PARAGRAPH_TEXTS["raw"] is not None:
+            return _PARAGRAPH_TEXTS["stripped"] if strip else _PARAGRAPH_TEXTS["raw"]
+        doc = get_document()
+
+    index = get_paragraph_index(doc)
+    return index.texts if strip else [paragraph_xml_text(para._p) for para in index.paragraphs]
+
+
+def walk_docx_files(search_dir: str):
+    """
+    Yield (file_path, filename) for every .docx file under search_dir, in os.walk order.
+    Uses os.scandir directly so files are matched by name without any extra stat calls.
+    Directory listings are cached and only re-read when the directory's mtime changes.
+    """
+    stack = [search_dir]
+    while stack:
+        root = stack.pop()
+        try:
+            mtime = os.stat(root).st_mtime_ns
+            cached = _DIR_LISTING_CACHE.get(root)
+            if cached is not None and cached[0] == mtime:
+                _, subdirs, files = cached
+            else:
+                subdirs = []
+                files = []
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.endswith('.docx') and not entry.name.startswith('~$'):  # Skip temp files
+                            files.append((entry.path, entry.name))
+                if len(_DIR_LISTING_CACHE) >= _DIR_LISTING_CACHE_SIZE:
+                    _DIR_LISTING_CACHE.clear()
+                _DIR_LISTING_CACHE[root] = (mtime, subdirs, files)
+        except OSError:
+            continue
+        yield from files
+        # Visit subdirectories in listing order
+        stack.extend(reversed(subdirs))
+
+
+def find_document_by_name(query: str, search_dir: str = ".", limit: int = None) -> list:
+    """
+    Find .docx files by fuzzy name matching in the specified directory.
+    Returns list of (file_path, filename, score) tuples sorted by score,
+    keeping only the best `limit` matches if a limit is given.
+    An exact (case-insensitive) name match is returned on its own as soon as it is found.
+    """
+    results = []
+    candidates = {}
+    query_lower = query.lower()
+    query_len = len(query_lower)
+
+    # A query naming a file directly in search_dir is the common case and needs no walk
+    file = query if query_lower.endswith('.docx') else query + '.docx'
+    if not file.startswith('~$') and os.path.basename(file) == file:
+        file_path = os.path.join(search_dir, file)
+        if os.path.isfile(file_path):
+            return [(file_path, file, 1.0)]
+
+    for file_path, file in walk_docx_files(search_dir):
+        filename = os.path.splitext(file)[0]  # Remove .docx extension
+        filename_lower = filename.lower()
+
+        # An exact name match can't be beaten, so stop walking the tree
+        if filename_lower == query_lower:
+            return [(file_path, file, 1.0)]
+
+        # Query contained in filename is always a match (for a substring, the ratio is its length bound)
+        if query_lower in filename_lower:
+            score = max(similarity_upper_bound(query_len, len(filename_lower)), 0.8)
+            results.append((file_path, file, score))
+        # Skip names whose length alone rules out reaching the threshold
+        elif similarity_upper_bound(query_len, len(filename_lower)) >= 0.3:
+            candidates[(file_path, file)] = filename
+
+    # Score the remaining candidates in one batch (rapidfuzz keeps only the top `limit`)
+    for filename, score, (file_path, file) in process.extract(
+        query, candidates, scorer=fuzz.ratio, processor=str.lower, score_cutoff=30, limit=limit
+    ):
+        results.append((file_path, file, score / 100.0))
 
     # Sort by score descending
     results.sort(key=lambda x: x[2], reverse=True)
-    return results
+    return results[:limit] if limit else results
 
 
-def similarity(a: str, b: str) -> float:
-    """Calculate similarity ratio between two strings using SequenceMatcher."""
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+def similarity_upper_bound(len_a: int, len_b: int) -> float:
+    """
+    Upper bound of fuzz.ratio (as a 0-1 score) for two strings of the given lengths.
+    The ratio is 2*matches/(len_a+len_b), and matches can never exceed the shorter length.
+    """
+    total = len_a + len_b
+    return 2 * min(len_a, len_b) / total if total else 1.0
 
 
 def find_paragraph_by_text(doc, query: str, threshold: float = 0.5):
@@ -92,61 +670,110 @@ def find_paragraph_by_text(doc, query: str, threshold: float = 0.5):
     """
     best_match = None
     best_score = 0
-
-    for idx, para in enumerate(doc.paragraphs):
-        text = para.text.strip()
-        if not text:
-            continue
-
-        # Check if query is contained in paragraph
-        if query.lower() in text.lower():
-            score = 0.9 + (0.1 * similarity(query, text))
+    query_lower = query.lower()
+    query_len = len(query_lower)
+    index = get_paragraph_index(doc)
+    paragraphs, lowers = index.paragraphs, index.lowers
+
+    # Containment matches score highest, so find the best of those first
+    for idx, text_lower in enumerate(lowers):
+        if text_lower and query_lower in text_lower:
+            # An exact match can't be beaten
+            if text_lower == query_lower:
+                return (idx, paragraphs[idx], 1.0)
+
+            # For a substring, the similarity is exactly its length bound
+            score = 0.9 + (0.1 * similarity_upper_bound(query_len, len(text_lower)))
             if score > best_score:
                 best_score = score
-                best_match = (idx, para, score)
-        else:
-            # Use fuzzy matching
-            score = similarity(query, text)
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = (idx, para, score)
+                best_match = (idx, paragraphs[idx], score)
+
+    # Fuzzy matching can only win if it beats both the threshold and the best containment score
+    min_score = max(threshold, best_score)
+    candidates = {}
+    for idx, text_lower in enumerate(lowers):
+        if not text_lower or query_lower in text_lower:
+            continue
+        # Skip paragraphs whose length alone rules out reaching min_score
+        if similarity_upper_bound(query_len, len(text_lower)) >= min_score:
+            candidates[idx] = text_lower
+
+    # Score all remaining candidates in one batch
+    fuzzy = process.extractOne(query_lower, candidates, scorer=fuzz.ratio, score_cutoff=min_score * 100)
+    # A score of 0 (nothing in common) is never a match, even with threshold 0
+    if fuzzy is not None and fuzzy[1] > 0:
+        _, score, idx = fuzzy
+        score = score / 100.0
+        # Ties go to the earlier paragraph
+        if best_match is None or score > best_score or (score == best_score and idx < best_match[0]):
+            best_match = (idx, paragraphs[idx], score)
 
     return best_match
 
 
-def find_placeholders(doc) -> list:
-    """Find all placeholders in the document (<<...>> or {{...>>), including inside tables."""
+def truncate_text(text: str, limit: int = 100) -> str:
+    """Shorten text to at most `limit` characters plus "..." for previews in tool results."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def may_contain_placeholder(text: str) -> bool:
+    """Cheap check that rules out text without any placeholder opener before running the regex."""
+    return '<<' in text or '{{' in text
+
+
+def find_placeholders(doc, max_details: int = 200) -> tuple[list, list, int]:
+    """
+    Find all placeholders in the document (<<...>> or {{...>>), including inside tables.
+    Returns (unique placeholders in order of first appearance, occurrence details, total occurrences).
+    Details are collected for at most max_details occurrences; the total counts all of them.
+    The result is reused until the document is edited.
+    """
+    if _PLACEHOLDER_SCAN["doc"] is doc and _PLACEHOLDER_SCAN["max_details"] == max_details:
+        return _PLACEHOLDER_SCAN["result"]
+
+    unique = {}  # Insertion-ordered set of placeholder names
     placeholders = []
-    pattern = re.compile(r'(<<[^<>]+>>|\{\{[^{}]+\}\})')
+    total = 0
 
     # Search in paragraphs
-    for idx, para in enumerate(doc.paragraphs):
-        matches = pattern.findall(para.text)
-        for match in matches:
-            placeholders.append({
-                "placeholder": match,
-                "location_type": "paragraph",
-                "paragraph_index": idx,
-                "context": para.text[:100] + "..." if len(para.text) > 100 else para.text
-            })
+    index = get_paragraph_index(doc)
+    for idx, para in enumerate(index.paragraphs):
+        if not may_contain_placeholder(index.texts[idx]):
+            continue
+        text = paragraph_xml_text(para._p)
+        for match in _PLACEHOLDER_RE.findall(text):
+            unique[match] = None
+            total += 1
+            if len(placeholders) < max_details:
+                placeholders.append({
+                    "placeholder": match,
+                    "location_type": "paragraph",
+                    "paragraph_index": idx,
+                    "context": truncate_text(text)
+                })
 
     # Search in tables
-    for table_idx, table in enumerate(doc.tables):
-        for row_idx, row in enumerate(table.rows):
-            for col_idx, cell in enumerate(row.cells):
-                cell_text = cell.text
-                matches = pattern.findall(cell_text)
-                for match in matches:
-                    placeholders.append({
-                        "placeholder": match,
-                        "location_type": "table",
-                        "table_index": table_idx,
-                        "row": row_idx,
-                        "column": col_idx,
-                        "context": cell_text[:100] + "..." if len(cell_text) > 100 else cell_text
-                    })
-
-    return placeholders
+    for table_idx, row_idx, col_idx, tc in iter_table_cells(doc):
+        cell_text = cell_xml_text(tc)
+        if not may_contain_placeholder(cell_text):
+            continue
+        for match in _PLACEHOLDER_RE.findall(cell_text):
+            unique[match] = None
+            total += 1
+            if len(placeholders) < max_details:
+                placeholders.append({
+                    "placeholder": match,
+                    "location_type": "table",
+                    "table_index": table_idx,
+                    "row": row_idx,
+                    "column": col_idx,
+                    "context": truncate_text(cell_text)
+                })
+
+    _PLACEHOLDER_SCAN["doc"] = doc
+    _PLACEHOLDER_SCAN["max_details"] = max_details
+    _PLACEHOLDER_SCAN["result"] = (list(unique), placeholders, total)
+    return _PLACEHOLDER_SCAN["result"]
 
 
 def replace_text_in_paragraph(paragraph, old_text: str, new_text: str) -> bool:
@@ -154,25 +781,35 @@ def replace_text_in_paragraph(paragraph, old_text: str, new_text: str) -> bool:
     Replace text in a paragraph, handling the case where text might be split across runs.
     Returns True if replacement was made.
     """
-    # First try simple replacement in the full text
-    if old_text in paragraph.text:
-        # Try to find and replace in individual runs first
-        for run in paragraph.runs:
+    # First try simple replacement in the full text (read straight from the XML)
+    full_text = paragraph_xml_text(paragraph._p)
+    if old_text in full_text:
+        # Cheapest case: the text sits inside a single <w:t> node, so edit it in place
+        if '\t' not in new_text and '\n' not in new_text:
+            for t in _PARAGRAPH_TEXT_NODES_XPATH(paragraph._p):
+                if t.text and old_text in t.text:
+                    t.text = t.text.replace(old_text, new_text)
+                    if t.text and (t.text[0].isspace() or t.text[-1].isspace()):
+                        t.set(qn('xml:space'), 'preserve')
+                    return True
+
+        # Try to find and replace in individual runs next (wrapped once, reused below)
+        runs = paragraph.runs
+        for run in runs:
             if old_text in run.text:
                 run.text = run.text.replace(old_text, new_text)
                 return True
 
         # If not found in individual runs, the text is split across runs
         # We need to rebuild the paragraph
-        full_text = paragraph.text
         new_full_text = full_text.replace(old_text, new_text)
 
         # Clear all runs and add the new text
-        for run in paragraph.runs:
+        for run in runs:
             run.text = ""
 
-        if paragraph.runs:
-            paragraph.runs[0].text = new_full_text
+        if runs:
+            runs[0].text = new_full_text
         else:
             paragraph.add_run(new_full_text)
 
@@ -181,41 +818,82 @@ def replace_text_in_paragraph(paragraph, old_text: str, new_text: str) -> bool:
     return False
 
 
+def replace_pattern_in_paragraph(paragraph, pattern, repl) -> set:
+    """
+    Replace every match of a compiled pattern in a paragraph in a single pass,
+    handling the case where matches might be split across runs.
+    Returns the set of distinct matched strings (empty if nothing was replaced).
+    """
+    full_text = paragraph.text
+    matches = pattern.findall(full_text)
+    if not matches:
+        return set()
+
+    runs = paragraph.runs
+
+    # If every match lives inside a single run, replace run by run to keep formatting
+    if sum(len(pattern.findall(run.text)) for run in runs) == len(matches):
+        for run in runs:
+            if pattern.search(run.text):
+                run.text = pattern.sub(repl, run.text)
+        return set(matches)
+
+    # Otherwise some matches are split across runs, so rebuild the paragraph
+    new_full_text = pattern.sub(repl, full_text)
+
+    for run in runs:
+        run.text = ""
+
+    if runs:
+        runs[0].text = new_full_text
+    else:
+        paragraph.add_run(new_full_text)
+
+    return set(matches)
+
+
+def pad_table_rows(rows: list[list[str]]) -> tuple:
+    """Pad rows with empty cells to the length of the longest row, as a tuple of tuples."""
+    cols = max(len(row) for row in rows)
+    return tuple(tuple(row) + ('',) * (cols - len(row)) for row in rows)
+
+
 def detect_table_format(text: str) -> tuple[str, list[list[str]]]:
     """
     Detect if text is a table and parse it.
     Returns (format_type, table_data) where format_type is 'markdown', 'tab', or None.
     table_data is a list of rows, where each row is a list of cell values.
+    Rows are padded with empty cells so they all have the same length.
     """
+    # Clients often retry the same table text, so parses of reasonably sized input are cached
+    parse = parse_table_text if len(text) <= _TABLE_PARSE_CACHE_MAX_TEXT else parse_table_text.__wrapped__
+    format_type, rows = parse(text)
+    return format_type, [list(row) for row in rows]
+
+
+@lru_cache(maxsize=128)
+def parse_table_text(text: str) -> tuple:
+    """Parse table text for detect_table_format(); returns immutable rows so results can be cached."""
     lines = [line.strip() for line in text.strip().split('\n') if line.strip()]
 
     if not lines:
-        return None, []
+        return None, ()
 
     # Check for markdown table format (| col1 | col2 |)
     if lines[0].startswith('|') and lines[0].endswith('|'):
         table_data = []
         for line in lines:
+            # Parse cells in a single scan
+            cells = [m.group(1).strip() for m in _MD_CELL_RE.finditer(line)]
+
             # Skip separator lines like |------|------| or |:-----|-----:|
-            # Check if line contains only dashes, colons, spaces, and pipes
-            if re.match(r'^\s*\|[\s\-:|]+\|\s*$', line):
-                # Further check: make sure it's mostly dashes (not actual content)
-                content = line.replace('|', '').replace('-', '').replace(':', '').replace(' ', '')
-                if len(content) == 0:
-                    continue
-
-            # Parse cells
-            cells = [cell.strip() for cell in line.split('|')[1:-1]]
-
-            # Skip if all cells are just dashes (another way separator lines appear)
-            if all(re.match(r'^[\s\-:]+$', cell) for cell in cells if cell):
+            if all(not cell or _CELL_SEP_RE.match(cell) for cell in cells):
                 continue
 
-            if cells:
-                table_data.append(cells)
+            table_data.append(cells)
 
         if len(table_data) >= 1:  # At least header (changed from 2 to 1)
-            return 'markdown', table_data
+            return 'markdown', pad_table_rows(table_data)
 
     # Check for tab-delimited format
     tab_rows = []
@@ -228,9 +906,9 @@ def detect_table_format(text: str) -> tuple[str, list[list[str]]]:
         # Check if all rows have similar column count
         col_counts = [len(row) for row in tab_rows]
         if max(col_counts) - min(col_counts) <= 1:  # Allow 1 column variance
-            return 'tab', tab_rows
+            return 'tab', pad_table_rows(tab_rows)
 
-    return None, []
+    return None, ()
 
 
 def copy_paragraph_formatting(source_para, target_para):
@@ -299,15 +977,9 @@ def apply_paragraph_formatting(paragraph, bold: bool = False, italic: bool = Fal
                 run.italic = True
 
     # Apply alignment
-    if alignment:
-        alignment_map = {
-            "left": WD_ALIGN_PARAGRAPH.LEFT,
-            "center": WD_ALIGN_PARAGRAPH.CENTER,
-            "right": WD_ALIGN_PARAGRAPH.RIGHT,
-            "justify": WD_ALIGN_PARAGRAPH.JUSTIFY
-        }
-        if alignment.lower() in alignment_map:
-            paragraph.alignment = alignment_map[alignment.lower()]
+    align = _ALIGNMENT_MAP.get(alignment.lower()) if alignment else None
+    if align is not None:
+        paragraph.alignment = align
 
     # Apply style
     if style:
@@ -318,6 +990,36 @@ def apply_paragraph_formatting(paragraph, bold: bool = False, italic: bool = Fal
             pass
 
 
+def set_cell_text(tc, text: str):
+    """
+    Set the text of a raw table cell (<w:tc>) in place.
+    Keeps the first paragraph and run with their formatting and drops the rest,
+    instead of rebuilding the cell like python-docx's cell.text does.
+    """
+    p = tc.find(qn('w:p'))
+    if p is None:
+        p = OxmlElement('w:p')
+        tc.append(p)
+
+    # Drop every other block in the cell (extra paragraphs, nested tables)
+    for child in list(tc):
+        if child is not p and child.tag != qn('w:tcPr'):
+            tc.remove(child)
+
+    r = p.find(qn('w:r'))
+    if r is None:
+        r = OxmlElement('w:r')
+        p.append(r)
+
+    # Drop every other run-level element, keeping paragraph properties
+    for child in list(p):
+        if child is not r and child.tag != qn('w:pPr'):
+            p.remove(child)
+
+    # Handles tabs and line breaks the same way Run.text does
+    r.text = text
+
+
 def create_word_table(doc, table_data: list[list[str]], has_header: bool = True):
     """
     Create a Word table from parsed table data.
@@ -326,11 +1028,16 @@ def create_word_table(doc, table_data: list[list[str]], has_header: bool = True)
     if not table_data or not table_data[0]:
         return None
 
+    # Rows from detect_table_format all have the same length
     rows = len(table_data)
-    cols = max(len(row) for row in table_data)
+    cols = len(table_data[0])
 
-    # Create table
-    table = doc.add_table(rows=rows, cols=cols)
+    # Create a single row, then clone it for the rest (much cheaper than add_table(rows=N))
+    table = doc.add_table(rows=1, cols=cols)
+    tbl = table._tbl
+    template_tr = tbl.tr_lst[0]
+    for _ in range(rows - 1):
+        tbl.append(copy.deepcopy(template_tr))
 
     # Apply the most common table style, fall back to default if not available
     try:
@@ -339,22 +1046,35 @@ def create_word_table(doc, table_data: list[list[str]], has_header: bool = True)
         # If style not available, leave as default (no borders)
         pass
 
-    # Fill in data
-    for i, row_data in enumerate(table_data):
-        row = table.rows[i]
-        for j, cell_value in enumerate(row_data):
-            if j < len(row.cells):
-                row.cells[j].text = cell_value
+    # Fill in data directly on the cell XML
+    for i, (tr, row_data) in enumerate(zip(tbl.tr_lst, table_data)):
+        for tc, cell_value in zip(tr.tc_lst, row_data):
+            set_cell_text(tc, cell_value)
 
-                # Make header row bold
-                if i == 0 and has_header:
-                    for paragraph in row.cells[j].paragraphs:
-                        for run in paragraph.runs:
-                            run.bold = True
+            # Make header row bold
+            if i == 0 and has_header:
+                tc.find(qn('w:p')).find(qn('w:r')).get_or_add_rPr().get_or_add_b()
 
     return table
 
 
+def is_blank_paragraph(element) -> bool:
+    """Check whether a body element is a paragraph without any text."""
+    return element is not None and element.tag == qn('w:p') and not paragraph_xml_text(element).strip()
+
+
+def add_table_spacers(table):
+    """
+    Put an empty paragraph before and after a table, unless the neighbour already is one.
+    Repeated table inserts therefore don't pile up blank paragraphs.
+    """
+    tbl = table._tbl
+    if not is_blank_paragraph(tbl.getprevious()):
+        tbl.addprevious(OxmlElement('w:p'))
+    if not is_blank_paragraph(tbl.getnext()):
+        tbl.addnext(OxmlElement('w:p'))
+
+
 # ============================================
 # Document Management Tools
 # ============================================
@@ -381,21 +1101,20 @@ async def list_documents(search_dir: str = ".") -> dict:
         search_dir: Directory to search in (default is current directory)
     """
     documents = []
-
-    for root, dirs, files in os.walk(search_dir):
-        for file in files:
-            if file.endswith('.docx') and not file.startswith('~$'):
-                file_path = os.path.join(root, file)
-                rel_path = os.path.relpath(file_path, search_dir)
-                documents.append({
-                    "filename": file,
-                    "path": rel_path,
-                    "full_path": os.path.abspath(file_path)
-                })
+    total = 0
+
+    for file_path, file in walk_docx_files(search_dir):
+        total += 1
+        if len(documents) < 50:  # Limit to 50 results; the rest are only counted
+            documents.append({
+                "filename": file,
+                "path": os.path.relpath(file_path, search_dir),
+                "full_path": os.path.abspath(file_path)
+            })
 
     return {
-        "total": len(documents),
-        "documents": documents[:50]  # Limit to 50 results
+        "total": total,
+        "documents": documents
     }
 
 
@@ -412,7 +1131,7 @@ async def switch_document(query: str, search_dir: str = ".") -> dict:
     global CURRENT_DOCX_PATH
 
     # Find matching documents
-    results = find_document_by_name(query, search_dir)
+    results = find_document_by_name(query, search_dir, limit=5)
 
     if not results:
         return {
@@ -424,6 +1143,9 @@ async def switch_document(query: str, search_dir: str = ".") -> dict:
     best_match = results[0]
     file_path, filename, score = best_match
 
+    # Write out pending edits before leaving the current document
+    flush_pending_save()
+
     # Update the current document path
     CURRENT_DOCX_PATH = file_path
 
@@ -456,26 +1178,43 @@ async def search(query: str) -> dict:
     Args:
         query: The search query string
     """
-    doc = get_document()
     results = []
+    query_lower = query.lower()
+    query_len = len(query_lower)
+    candidates = {}
+    min_score = 0.3
+    texts = get_paragraph_texts()
 
-    for idx, para in enumerate(doc.paragraphs):
-        text = para.text.strip()
+    for idx, text in enumerate(texts):
         if not text:
             continue
+        text_lower = text.lower()
 
         # Check containment first
-        if query.lower() in text.lower():
-            score = 0.9
-        else:
-            score = similarity(query, text)
-
-        if score >= 0.3:  # Lower threshold for more results
-            results.append({
-                "id": f"para-{idx}",
-                "score": round(score, 2),
-                "text": text[:200] + "..." if len(text) > 200 else text
-            })
+        if query_lower in text_lower:
+            # Later containment matches tie with the first 10 and would be cut off anyway
+            if len(results) < 10:
+                results.append({
+                    "id": f"para-{idx}",
+                    "score": 0.9,
+                    "text": truncate_text(text, 200)
+                })
+                if len(results) == 10:
+                    # From now on only fuzzy matches scoring above 0.9 can make the top 10
+                    min_score = 0.9
+        elif similarity_upper_bound(query_len, len(text_lower)) >= min_score:
+            candidates[idx] = text_lower
+
+    # Fuzzy-score the remaining paragraphs in one batch, keeping the top 10
+    for _, score, idx in process.extract(
+        query_lower, candidates, scorer=fuzz.ratio, score_cutoff=min_score * 100, limit=10
+    ):
+        text = texts[idx]
+        results.append({
+            "id": f"para-{idx}",
+            "score": round(score / 100.0, 2),
+            "text": truncate_text(text, 200)
+        })
 
     # Sort by score descending
     results.sort(key=lambda x: x["score"], reverse=True)
@@ -503,16 +1242,16 @@ async def fetch(id: str) -> dict:
     except ValueError:
         return {"error": f"Invalid ID format: {id}"}
 
-    if idx < 0 or idx >= len(doc.paragraphs):
+    para = get_paragraph_by_index(doc, idx)
+    if para is None:
         return {"error": f"Paragraph {id} not found"}
 
-    para = doc.paragraphs[idx]
-
+    style = para.style
     return {
         "id": id,
         "index": idx,
-        "text": para.text,
-        "style": para.style.name if para.style else None
+        "text": paragraph_xml_text(para._p),
+        "style": style.name if style else None
     }
 
 
@@ -525,12 +1264,9 @@ async def read_document() -> dict:
     """
     Read the full text content of the document.
     """
-    doc = get_document()
-    full_text = []
-    for para in doc.paragraphs:
-        if para.text.strip():
-            full_text.append(para.text)
-    return {"text": "\n".join(full_text)}
+    texts = get_paragraph_texts(strip=False)
+    # Skip blank paragraphs without allocating a stripped copy of each one
+    return {"text": "\n".join(text for text in texts if text and not text.isspace())}
 
 
 @mcp.tool()
@@ -542,22 +1278,20 @@ async def get_paragraphs(limit: int = 50, start_index: int = 0) -> dict:
         limit: Maximum number of paragraphs to return (default 50)
         start_index: Index to start reading from (default 0)
     """
-    doc = get_document()
-    paragraphs = []
+    texts = get_paragraph_texts()
+    non_empty = [idx for idx, text in enumerate(texts) if text]
 
-    for idx, para in enumerate(doc.paragraphs):
-        text = para.text.strip()
-        if text:
-            paragraphs.append({
-                "id": f"para-{idx}",
-                "text": text[:100] + "..." if len(text) > 100 else text
-            })
-
-    # Slice the result
-    sliced = paragraphs[start_index : start_index + limit]
+    # Only build entries for the requested page
+    sliced = []
+    for idx in non_empty[start_index : start_index + limit]:
+        text = texts[idx]
+        sliced.append({
+            "id": f"para-{idx}",
+            "text": truncate_text(text)
+        })
 
     return {
-        "total_paragraphs": len(paragraphs),
+        "total_paragraphs": len(non_empty),
         "start_index": start_index,
         "showing": len(sliced),
         "paragraphs": sliced
@@ -569,6 +1303,7 @@ async def get_paragraphs(limit: int = 50, start_index: int = 0) -> dict:
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def add_paragraph(
     text: str,
     bold: bool = False,
@@ -597,6 +1332,7 @@ async def add_paragraph(
 
 
 @mcp.tool()
+@editing_tool
 async def update_paragraph(
     id: str,
     text: str,
@@ -628,16 +1364,16 @@ async def update_paragraph(
     except ValueError:
         return {"error": f"Invalid ID format: {id}"}
 
-    if idx < 0 or idx >= len(doc.paragraphs):
+    para = get_paragraph_by_index(doc, idx)
+    if para is None:
         return {"error": f"Paragraph {id} not found"}
 
-    para = doc.paragraphs[idx]
-
     # Clear existing runs and set new text
-    for run in para.runs:
+    runs = para.runs
+    for run in runs:
         run.text = ""
-    if para.runs:
-        para.runs[0].text = text
+    if runs:
+        runs[0].text = text
     else:
         para.add_run(text)
 
@@ -656,6 +1392,7 @@ async def update_paragraph(
 
 
 @mcp.tool()
+@editing_tool
 async def insert_before_text(
     query: str,
     text: str,
@@ -711,11 +1448,12 @@ async def insert_before_text(
     return {
         "status": "success",
         "message": f"Content inserted before paragraph {idx} (match score: {score:.2f})",
-        "matched_text": para.text[:100] + "..." if len(para.text) > 100 else para.text
+        "matched_text": truncate_text(para.text)
     }
 
 
 @mcp.tool()
+@editing_tool
 async def insert_after_text(
     query: str,
     text: str,
@@ -773,11 +1511,12 @@ async def insert_after_text(
     return {
         "status": "success",
         "message": f"Content inserted after paragraph {idx} (match score: {score:.2f})",
-        "matched_text": para.text[:100] + "..." if len(para.text) > 100 else para.text
+        "matched_text": truncate_text(para.text)
     }
 
 
 @mcp.tool()
+@editing_tool
 async def insert_after_heading(heading_text: str, text: str) -> dict:
     """
     INSERT CONTENT AFTER A SECTION/HEADING.
@@ -789,24 +1528,36 @@ async def insert_after_heading(heading_text: str, text: str) -> dict:
         text: The text content to insert after that section
     """
     doc = get_document()
+    index = get_paragraph_index(doc)
+    heading_text_lower = heading_text.lower()
 
     # Find the heading
     heading_idx = None
     heading_level = None
+    heading_pos = None
 
-    for idx, para in enumerate(doc.paragraphs):
-        if para.style and para.style.name.startswith('Heading'):
-            if heading_text.lower() in para.text.lower():
-                heading_idx = idx
-                # Extract heading level (e.g., "Heading 1" -> 1)
-                try:
-                    heading_level = int(para.style.name.replace('Heading ', ''))
-                except ValueError:
-                    heading_level = 1
-                break
+    for pos, (idx, level) in enumerate(index.headings):
+        if heading_text_lower in index.lowers[idx]:
+            heading_idx = idx
+            heading_pos = pos
+            heading_level = level if level is not None else 1
+            break
+
+    if heading_idx is None and index.headings:
+        # Try fuzzy matching on the headings only
+        match = process.extractOne(
+            heading_text_lower,
+            {pos: index.lowers[idx] for pos, (idx, _) in enumerate(index.headings)},
+            scorer=fuzz.ratio,
+            score_cutoff=60
+        )
+        if match:
+            heading_pos = match[2]
+            heading_idx, level = index.headings[heading_pos]
+            heading_level = level if level is not None else 1
 
     if heading_idx is None:
-        # Try fuzzy matching on all paragraphs if no heading style found
+        # Try fuzzy matching on all paragraphs if no heading style matched
         match = find_paragraph_by_text(doc, heading_text, 0.6)
         if match:
             heading_idx = match[0]
@@ -819,20 +1570,14 @@ async def insert_after_heading(heading_text: str, text: str) -> dict:
     insert_idx = heading_idx
 
     if heading_level:
-        for idx in range(heading_idx + 1, len(doc.paragraphs)):
-            para = doc.paragraphs[idx]
-            if para.style and para.style.name.startswith('Heading'):
-                try:
-                    level = int(para.style.name.replace('Heading ', ''))
-                    if level <= heading_level:
-                        insert_idx = idx - 1
-                        break
-                except ValueError:
-                    pass
-            insert_idx = idx
+        insert_idx = len(index.paragraphs) - 1
+        for idx, level in index.headings[heading_pos + 1:]:
+            if level is not None and level <= heading_level:
+                insert_idx = idx - 1
+                break
 
     # Insert the new paragraph
-    target_para = doc.paragraphs[insert_idx]
+    target_para = index.paragraphs[insert_idx]
     new_para = doc.add_paragraph(text)
     target_para._element.addnext(new_para._element)
 
@@ -858,10 +1603,7 @@ async def list_placeholders() -> dict:
     ALWAYS call this tool first to discover placeholders, then use replace_placeholder to fill them in.
     """
     doc = get_document()
-    placeholders = find_placeholders(doc)
-
-    # Get unique placeholder names
-    unique = list(set(p["placeholder"] for p in placeholders))
+    unique, placeholders, total = find_placeholders(doc)
 
     if not unique:
         return {
@@ -872,11 +1614,14 @@ async def list_placeholders() -> dict:
     return {
         "found": len(unique),
         "placeholders": unique,
-        "details": placeholders
+        "total_occurrences": total,
+        "details": placeholders,
+        "details_truncated": len(placeholders) < total
     }
 
 
 @mcp.tool()
+@editing_tool
 async def replace_placeholder(placeholder: str, value: str) -> dict:
     """
     TEMPLATE SUPPORT - USE THIS TO FILL PLACEHOLDERS.
@@ -893,18 +1638,18 @@ async def replace_placeholder(placeholder: str, value: str) -> dict:
     doc = get_document()
     count = 0
 
-    # Replace in paragraphs
-    for para in doc.paragraphs:
-        if placeholder in para.text:
-            if replace_text_in_paragraph(para, placeholder, value):
-                count += 1
-
-    # Replace in table cells
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                if placeholder in cell.text:
-                    cell.text = cell.text.replace(placeholder, value)
+    # Replace in paragraphs, skipping those whose cached text can't contain the placeholder
+    index = get_paragraph_index(doc)
+    needle = placeholder.strip()
+    for para, text in zip(index.paragraphs, index.texts):
+        if needle in text and replace_text_in_paragraph(para, placeholder, value):
+            count += 1
+
+    # Replace in table cells, editing the runs in place so their formatting is kept
+    for _, _, _, tc in iter_table_cells(doc):
+        for p in tc.iterchildren(qn('w:p')):
+            if placeholder in paragraph_xml_text(p):
+                if replace_text_in_paragraph(Paragraph(p, doc), placeholder, value):
                     count += 1
 
     if count == 0:
@@ -920,6 +1665,7 @@ async def replace_placeholder(placeholder: str, value: str) -> dict:
 
 
 @mcp.tool()
+@editing_tool
 async def replace_placeholders(replacements: dict) -> dict:
     """
     TEMPLATE SUPPORT: Replace multiple placeholders at once.
@@ -930,28 +1676,33 @@ async def replace_placeholders(replacements: dict) -> dict:
         replacements: Object mapping placeholders to their values, e.g., {"<<Name>>": "John", "<<Date>>": "2024-01-15"}
     """
     doc = get_document()
-    total_count = 0
-    results = {}
+    results = {placeholder: 0 for placeholder in replacements}
+
+    # Match all placeholders with one regex (longest first) so the document is scanned once
+    keys = sorted((placeholder for placeholder in replacements if placeholder), key=len, reverse=True)
 
-    for placeholder, value in replacements.items():
-        count = 0
+    if keys:
+        pattern = re.compile('|'.join(re.escape(placeholder) for placeholder in keys))
+
+        def repl(match):
+            # JSON clients often send numbers; a non-str value would fail halfway through the edit
+            return str(replacements[match.group(0)])
 
         # Replace in paragraphs
-        for para in doc.paragraphs:
-            if placeholder in para.text:
-                if replace_text_in_paragraph(para, placeholder, value):
-                    count += 1
+        index = get_paragraph_index(doc)
+        for para, text in zip(index.paragraphs, index.texts):
+            if pattern.search(text):
+                for placeholder in replace_pattern_in_paragraph(para, pattern, repl):
+                    results[placeholder] += 1
 
-        # Replace in table cells
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    if placeholder in cell.text:
-                        cell.text = cell.text.replace(placeholder, value)
-                        count += 1
+        # Replace in table cells, editing the runs in place so their formatting is kept
+        for _, _, _, tc in iter_table_cells(doc):
+            for p in tc.iterchildren(qn('w:p')):
+                if pattern.search(paragraph_xml_text(p)):
+                    for placeholder in replace_pattern_in_paragraph(Paragraph(p, doc), pattern, repl):
+                        results[placeholder] += 1
 
-        results[placeholder] = count
-        total_count += count
+    total_count = sum(results.values())
 
     save_document(doc)
 
@@ -967,7 +1718,8 @@ async def replace_placeholders(replacements: dict) -> dict:
 # ============================================
 
 @mcp.tool()
-async def insert_table(text: str, has_header: bool = True, query: str = None) -> dict:
+@editing_tool
+async def insert_table(text: str, has_header: bool = True, query: str = None, with_spacers: bool = True) -> dict:
     """
     INSERT A PROPER WORD TABLE into the document.
     Automatically detects and converts markdown or tab-delimited table text into a real Word table.
@@ -980,6 +1732,7 @@ async def insert_table(text: str, has_header: bool = True, query: str = None) ->
         text: The table content (markdown or tab-delimited format)
         has_header: Whether the first row is a header (default True)
         query: Optional - text to search for to insert table after. If not provided, adds to end.
+        with_spacers: Surround the table with empty paragraphs where there aren't any yet (default True)
     """
     doc = get_document()
 
@@ -989,7 +1742,7 @@ async def insert_table(text: str, has_header: bool = True, query: str = None) ->
     if not format_type:
         return {
             "error": "Could not detect table format. Please use markdown (| col |) or tab-delimited format.",
-            "received_text": text[:200] + "..." if len(text) > 200 else text
+            "received_text": truncate_text(text, 200)
         }
 
     # If query provided, find insertion point
@@ -1006,23 +1759,12 @@ async def insert_table(text: str, has_header: bool = True, query: str = None) ->
     if not table:
         return {"error": "Failed to create table"}
 
-    # Move table to correct position if query was provided
+    # Move table to correct position if query was provided (otherwise it is already at the end)
     if insert_after_para:
-        # Add space before table
-        space_before = doc.add_paragraph()
-        insert_after_para._element.addnext(space_before._element)
-
-        # Add table after the space
-        space_before._element.addnext(table._element)
+        insert_after_para._element.addnext(table._element)
 
-        # Add space after table
-        space_after = doc.add_paragraph()
-        table._element.addnext(space_after._element)
-    else:
-        # If adding to end of document, add spaces too
-        doc.add_paragraph()  # Space before
-        # Table is already at the end
-        doc.add_paragraph()  # Space after
+    if with_spacers:
+        add_table_spacers(table)
 
     save_document(doc)
 
@@ -1036,7 +1778,13 @@ async def insert_table(text: str, has_header: bool = True, query: str = None) ->
 
 
 @mcp.tool()
-async def convert_text_to_table(query: str, has_header: bool = True, threshold: float = 0.5) -> dict:
+@editing_tool
+async def convert_text_to_table(
+    query: str,
+    has_header: bool = True,
+    threshold: float = 0.5,
+    with_spacers: bool = True
+) -> dict:
     """
     CONVERT EXISTING TEXT PARAGRAPH(S) into a proper Word table.
     Finds paragraph(s) containing table-like text and replaces them with a real Word table.
@@ -1048,6 +1796,7 @@ async def convert_text_to_table(query: str, has_header: bool = True, threshold:
         query: Text to search for to find the paragraph(s) containing the table
         has_header: Whether the first row is a header (default True)
         threshold: Minimum similarity score for text matching (0-1, default 0.5)
+        with_spacers: Surround the table with empty paragraphs where there aren't any yet (default True)
     """
     doc = get_document()
 
@@ -1063,10 +1812,11 @@ async def convert_text_to_table(query: str, has_header: bool = True, threshold:
     table_paragraphs = [para]
     table_indices = [idx]
 
-    # Check if following paragraphs are also table rows
-    for i in range(idx + 1, min(idx + 20, len(doc.paragraphs))):
-        next_para = doc.paragraphs[i]
-        text = next_para.text.strip()
+    # Check if following paragraphs are also table rows (the index is already built by the match above)
+    index = get_paragraph_index(doc)
+    for i in range(idx + 1, min(idx + 20, len(index.paragraphs))):
+        next_para = index.paragraphs[i]
+        text = index.texts[i]
 
         if not text:
             break  # Empty line signals end of table
@@ -1078,8 +1828,8 @@ async def convert_text_to_table(query: str, has_header: bool = True, threshold:
         else:
             break
 
-    # Combine all paragraphs into one text block
-    combined_text = '\n'.join(p.text for p in table_paragraphs)
+    # Combine all paragraphs into one text block (lines are stripped by the parser anyway)
+    combined_text = '\n'.join(index.texts[i] for i in table_indices)
 
     # Detect and parse table format
     format_type, table_data = detect_table_format(combined_text)
@@ -1087,7 +1837,7 @@ async def convert_text_to_table(query: str, has_header: bool = True, threshold:
     if not format_type:
         return {
             "error": "Could not detect table format in the matched paragraph(s).",
-            "matched_text": combined_text[:200] + "..." if len(combined_text) > 200 else combined_text
+            "matched_text": truncate_text(combined_text, 200)
         }
 
     # Create the Word table
@@ -1096,20 +1846,16 @@ async def convert_text_to_table(query: str, has_header: bool = True, threshold:
     if not table:
         return {"error": "Failed to create table"}
 
-    # Add space before table
-    space_before = doc.add_paragraph()
-    table_paragraphs[0]._element.addprevious(space_before._element)
-
-    # Insert table after the space
-    space_before._element.addnext(table._element)
-
-    # Add space after table
-    space_after = doc.add_paragraph()
-    table._element.addnext(space_after._element)
+    # Put the table where the text was
+    table_paragraphs[0]._element.addprevious(table._element)
 
-    # Delete all the old text paragraphs
+    # Delete all the old text paragraphs (they are consecutive siblings of the table)
+    body = table._element.getparent()
     for p in table_paragraphs:
-        p._element.getparent().remove(p._element)
+        body.remove(p._element)
+
+    if with_spacers:
+        add_table_spacers(table)
 
     save_document(doc)
 
@@ -1137,13 +1883,14 @@ async def list_tables() -> dict:
     tables_info = []
 
     for idx, table in enumerate(doc.tables):
-        rows = len(table.rows)
-        cols = len(table.columns) if rows > 0 else 0
+        tbl = table._tbl
+        rows = len(tbl.tr_lst)
+        cols = len(tbl.tblGrid.gridCol_lst) if rows > 0 else 0
 
         # Get first row as preview
         first_row = []
         if rows > 0:
-            first_row = [cell.text.strip() for cell in table.rows[0].cells]
+            first_row = [cell.text.strip() for cell in table.rows[0].cells[:5]]
 
         tables_info.append({
             "table_index": idx,
@@ -1167,26 +1914,24 @@ async def read_table(table_index: int) -> dict:
         table_index: The index of the table (from list_tables, starting at 0)
     """
     doc = get_document()
+    tables = doc.tables
 
-    if table_index < 0 or table_index >= len(doc.tables):
-        return {"error": f"Table index {table_index} not found. Document has {len(doc.tables)} table(s)."}
-
-    table = doc.tables[table_index]
-    table_data = []
+    if table_index < 0 or table_index >= len(tables):
+        return {"error": f"Table index {table_index} not found. Document has {len(tables)} table(s)."}
 
-    for row in table.rows:
-        row_data = [cell.text.strip() for cell in row.cells]
-        table_data.append(row_data)
+    table = tables[table_index]
+    table_data = table_text_grid(table._tbl)
 
     return {
         "table_index": table_index,
-        "rows": len(table.rows),
-        "columns": len(table.columns),
+        "rows": len(table_data),
+        "columns": len(table._tbl.tblGrid.gridCol_lst),
         "data": table_data
     }
 
 
 @mcp.tool()
+@editing_tool
 async def update_table_cell(table_index: int, row: int, column: int, text: str) -> dict:
     """
     Update a specific cell in a table by row and column index.
@@ -1199,21 +1944,24 @@ async def update_table_cell(table_index: int, row: int, column: int, text: str)
         text: The new text content for the cell
     """
     doc = get_document()
+    tables = doc.tables
 
-    if table_index < 0 or table_index >= len(doc.tables):
-        return {"error": f"Table index {table_index} not found. Document has {len(doc.tables)} table(s)."}
+    if table_index < 0 or table_index >= len(tables):
+        return {"error": f"Table index {table_index} not found. Document has {len(tables)} table(s)."}
 
-    table = doc.tables[table_index]
+    table = tables[table_index]
+    num_rows = len(table._tbl.tr_lst)
+    num_cols = len(table._tbl.tblGrid.gridCol_lst)
 
-    if row < 0 or row >= len(table.rows):
-        return {"error": f"Row index {row} out of range. Table has {len(table.rows)} rows."}
+    if row < 0 or row >= num_rows:
+        return {"error": f"Row index {row} out of range. Table has {num_rows} rows."}
 
-    if column < 0 or column >= len(table.columns):
-        return {"error": f"Column index {column} out of range. Table has {len(table.columns)} columns."}
+    if column < 0 or column >= num_cols:
+        return {"error": f"Column index {column} out of range. Table has {num_cols} columns."}
 
     # Update the cell
     cell = table.rows[row].cells[column]
-    cell.text = text
+    set_cell_text(cell._tc, text)
 
     save_document(doc)
 
@@ -1225,6 +1973,7 @@ async def update_table_cell(table_index: int, row: int, column: int, text: str)
 
 
 @mcp.tool()
+@editing_tool
 async def add_table_row(table_index: int, row_data: list = None) -> dict:
     """
     Add a new row to the end of a table, optionally with data.
@@ -1234,30 +1983,32 @@ async def add_table_row(table_index: int, row_data: list = None) -> dict:
         row_data: Optional list of cell values for the new row
     """
     doc = get_document()
+    tables = doc.tables
 
-    if table_index < 0 or table_index >= len(doc.tables):
-        return {"error": f"Table index {table_index} not found. Document has {len(doc.tables)} table(s)."}
+    if table_index < 0 or table_index >= len(tables):
+        return {"error": f"Table index {table_index} not found. Document has {len(tables)} table(s)."}
 
-    table = doc.tables[table_index]
+    table = tables[table_index]
     new_row = table.add_row()
 
     # Fill in data if provided
     if row_data:
-        for col_idx, value in enumerate(row_data):
-            if col_idx < len(new_row.cells):
-                new_row.cells[col_idx].text = str(value)
+        for cell, value in zip(new_row.cells, row_data):
+            set_cell_text(cell._tc, str(value))
 
     save_document(doc)
 
+    total_rows = len(table._tbl.tr_lst)
     return {
         "status": "success",
         "message": f"Added row to table {table_index}",
-        "new_row_index": len(table.rows) - 1,
-        "total_rows": len(table.rows)
+        "new_row_index": total_rows - 1,
+        "total_rows": total_rows
     }
 
 
 @mcp.tool()
+@editing_tool
 async def update_table_row(table_index: int, row: int, row_data: list) -> dict:
     """
     Update an entire row in a table with new data.
@@ -1268,31 +2019,33 @@ async def update_table_row(table_index: int, row: int, row_data: list) -> dict:
         row_data: List of cell values for the row
     """
     doc = get_document()
+    tables = doc.tables
 
-    if table_index < 0 or table_index >= len(doc.tables):
-        return {"error": f"Table index {table_index} not found. Document has {len(doc.tables)} table(s)."}
+    if table_index < 0 or table_index >= len(tables):
+        return {"error": f"Table index {table_index} not found. Document has {len(tables)} table(s)."}
 
-    table = doc.tables[table_index]
+    table = tables[table_index]
+    num_rows = len(table._tbl.tr_lst)
 
-    if row < 0 or row >= len(table.rows):
-        return {"error": f"Row index {row} out of range. Table has {len(table.rows)} rows."}
+    if row < 0 or row >= num_rows:
+        return {"error": f"Row index {row} out of range. Table has {num_rows} rows."}
 
-    # Update each cell in the row
-    table_row = table.rows[row]
-    for col_idx, value in enumerate(row_data):
-        if col_idx < len(table_row.cells):
-            table_row.cells[col_idx].text = str(value)
+    # Update each cell in the row (cells are resolved once, not per value)
+    row_cells = table.rows[row].cells
+    for cell, value in zip(row_cells, row_data):
+        set_cell_text(cell._tc, str(value))
 
     save_document(doc)
 
     return {
         "status": "success",
         "message": f"Updated row {row} in table {table_index}",
-        "cells_updated": min(len(row_data), len(table_row.cells))
+        "cells_updated": min(len(row_data), len(row_cells))
     }
 
 
 @mcp.tool()
+@editing_tool
 async def delete_table_row(table_index: int, row: int) -> dict:
     """
     Delete a row from a table.
@@ -1302,24 +2055,26 @@ async def delete_table_row(table_index: int, row: int) -> dict:
         row: The row index to delete (starting at 0)
     """
     doc = get_document()
+    tables = doc.tables
 
-    if table_index < 0 or table_index >= len(doc.tables):
-        return {"error": f"Table index {table_index} not found. Document has {len(doc.tables)} table(s)."}
+    if table_index < 0 or table_index >= len(tables):
+        return {"error": f"Table index {table_index} not found. Document has {len(tables)} table(s)."}
 
-    table = doc.tables[table_index]
+    table = tables[table_index]
+    tr_lst = table._tbl.tr_lst
 
-    if row < 0 or row >= len(table.rows):
-        return {"error": f"Row index {row} out of range. Table has {len(table.rows)} rows."}
+    if row < 0 or row >= len(tr_lst):
+        return {"error": f"Row index {row} out of range. Table has {len(tr_lst)} rows."}
 
     # Delete the row using XML manipulation
-    table._element.remove(table.rows[row]._element)
+    table._element.remove(tr_lst[row])
 
     save_document(doc)
 
     return {
         "status": "success",
         "message": f"Deleted row {row} from table {table_index}",
-        "remaining_rows": len(table.rows)
+        "remaining_rows": len(tr_lst) - 1
     }
 
 
@@ -1328,6 +2083,7 @@ async def delete_table_row(table_index: int, row: int) -> dict:
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def format_paragraph(
     query: str,
     bold: bool = None,
@@ -1362,31 +2118,25 @@ async def format_paragraph(
 
     idx, para, score = match
 
-    # Apply text formatting (bold, italic, underline)
-    if bold is not None or italic is not None or underline is not None:
+    # Apply text formatting (bold, italic, underline, font size) in a single pass over the runs
+    if bold is not None or italic is not None or underline is not None or font_size:
+        size = Pt(font_size) if font_size else None
         for run in para.runs:
+            if not run.text:
+                continue  # Nothing visible to format
             if bold is not None:
                 run.bold = bold
             if italic is not None:
                 run.italic = italic
             if underline is not None:
                 run.underline = underline
-
-    # Apply font size
-    if font_size:
-        for run in para.runs:
-            run.font.size = Pt(font_size)
+            if size is not None:
+                run.font.size = size
 
     # Apply alignment
-    if alignment:
-        alignment_map = {
-            "left": WD_ALIGN_PARAGRAPH.LEFT,
-            "center": WD_ALIGN_PARAGRAPH.CENTER,
-            "right": WD_ALIGN_PARAGRAPH.RIGHT,
-            "justify": WD_ALIGN_PARAGRAPH.JUSTIFY
-        }
-        if alignment.lower() in alignment_map:
-            para.alignment = alignment_map[alignment.lower()]
+    align = _ALIGNMENT_MAP.get(alignment.lower()) if alignment else None
+    if align is not None:
+        para.alignment = align
 
     # Apply style
     if style:
@@ -1400,7 +2150,7 @@ async def format_paragraph(
     return {
         "status": "success",
         "message": f"Applied formatting to paragraph {idx} (match score: {score:.2f})",
-        "matched_text": para.text[:100] + "..." if len(para.text) > 100 else para.text
+        "matched_text": truncate_text(para.text)
     }
 
 
@@ -1409,6 +2159,7 @@ async def format_paragraph(
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def replace_text(old_text: str, new_text: str) -> dict:
     """
     FIND AND REPLACE any text anywhere in the document.
@@ -1427,14 +2178,21 @@ async def replace_text(old_text: str, new_text: str) -> dict:
     count = 0
     affected_paragraphs = []
 
-    for idx, para in enumerate(doc.paragraphs):
-        if old_text in para.text:
-            if replace_text_in_paragraph(para, old_text, new_text):
-                count += 1
-                affected_paragraphs.append({
-                    "id": f"para-{idx}",
-                    "preview": para.text[:100] + "..." if len(para.text) > 100 else para.text
-                })
+    # Any paragraph containing old_text also has old_text.strip() in its stripped text,
+    # so the cached index texts rule out most paragraphs without touching the XML
+    index = get_paragraph_index(doc)
+    needle = old_text.strip()
+
+    for idx, para in enumerate(index.paragraphs):
+        if needle not in index.texts[idx]:
+            continue
+        # replace_text_in_paragraph does the exact check itself
+        if replace_text_in_paragraph(para, old_text, new_text):
+            count += 1
+            affected_paragraphs.append({
+                "id": f"para-{idx}",
+                "preview": truncate_text(paragraph_xml_text(para._p))
+            })
 
     if count == 0:
         return {
@@ -1480,11 +2238,72 @@ async def save_document_as(filename: str) -> dict:
     }
 
 
+@mcp.tool()
+async def flush_document(reload: bool = False) -> dict:
+    """
+    Write pending edits of the current document to disk immediately.
+    Edits are saved automatically shortly after each change; use this when the file
+    must be up to date right now (e.g., before opening it in Word).
+
+    Args:
+        reload: Also drop the in-memory copy so the next tool call re-reads the file
+                (use after editing the file outside this server)
+    """
+    pending = _DOC_STATE["dirty"]
+    path = _DOC_STATE["path"] or CURRENT_DOCX_PATH
+
+    try:
+        flush_pending_save()
+    except Exception:
+        # Nothing was written; keep the edits in memory and report why
+        error = _DOC_STATE["save_error"]
+        _DOC_STATE["save_error"] = None
+        return {"error": error, "path": os.path.abspath(path), "pending_changes": True}
+
+    if reload:
+        _DOC_CACHE.pop(CURRENT_DOCX_PATH, None)
+        if _DOC_STATE["path"] == CURRENT_DOCX_PATH:
+            _DOC_STATE["path"] = None
+            _DOC_STATE["doc"] = None
+
+    return {
+        "status": "success",
+        "message": "Pending changes saved." if pending else "No pending changes.",
+        "path": os.path.abspath(path),
+        "reloaded": reload
+    }
+
+
+@mcp.tool()
+async def set_autosave(enabled: bool) -> dict:
+    """
+    Turn automatic saving on or off.
+    Turn it off before a long series of edits so the file is written only once,
+    then call flush_document (or turn autosave back on) to save.
+    Pending edits are still saved when switching documents or shutting down.
+
+    Args:
+        enabled: True to save automatically after edits, False to save only on flush
+    """
+    _DOC_STATE["autosave"] = enabled
+
+    # Re-enabling: write out whatever was held back
+    if enabled:
+        flush_pending_save()
+
+    return {
+        "status": "success",
+        "autosave": enabled,
+        "pending_changes": _DOC_STATE["dirty"]
+    }
+
+
 # ============================================
 # Paragraph Management Tools
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def delete_paragraph(query: str, threshold: float = 0.5) -> dict:
     """
     DELETE a paragraph from the document by fuzzy text search.
@@ -1511,11 +2330,12 @@ async def delete_paragraph(query: str, threshold: float = 0.5) -> dict:
     return {
         "status": "success",
         "message": f"Deleted paragraph {idx} (match score: {score:.2f})",
-        "deleted_text": deleted_text[:100] + "..." if len(deleted_text) > 100 else deleted_text
+        "deleted_text": truncate_text(deleted_text)
     }
 
 
 @mcp.tool()
+@editing_tool
 async def move_paragraph(query: str, target_query: str, position: str = "after", threshold: float = 0.5) -> dict:
     """
     MOVE a paragraph to a new location in the document.
@@ -1562,12 +2382,13 @@ async def move_paragraph(query: str, target_query: str, position: str = "after",
     return {
         "status": "success",
         "message": f"Moved paragraph {position} target",
-        "moved_text": source_para.text[:100] + "..." if len(source_para.text) > 100 else source_para.text,
-        "target_text": target_para.text[:100] + "..." if len(target_para.text) > 100 else target_para.text
+        "moved_text": truncate_text(source_para.text),
+        "target_text": truncate_text(target_para.text)
     }
 
 
 @mcp.tool()
+@editing_tool
 async def merge_paragraphs(query1: str, query2: str, separator: str = " ", threshold: float = 0.5) -> dict:
     """
     MERGE two paragraphs into one. The second paragraph's text is appended to the first,
@@ -1596,15 +2417,17 @@ async def merge_paragraphs(query1: str, query2: str, separator: str = " ", thres
     if idx1 == idx2:
         return {"error": "Both queries match the same paragraph"}
 
-    # Merge text
-    original_text1 = para1.text
-    para2_text = para2.text
+    # Add the separator in the formatting of the first paragraph's last run
+    if separator:
+        runs = para1.runs
+        sep_run = para1.add_run(separator)
+        if runs and runs[-1]._r.rPr is not None:
+            sep_run._r.insert(0, copy.deepcopy(runs[-1]._r.rPr))
 
-    # Add separator and second paragraph text to first paragraph
-    if para1.runs:
-        para1.runs[-1].text += separator + para2_text
-    else:
-        para1.add_run(separator + para2_text)
+    # Move the second paragraph's content (runs, hyperlinks, ...) over as-is, keeping its formatting
+    for child in list(para2._element):
+        if child.tag != qn('w:pPr'):
+            para1._element.append(child)
 
     # Delete the second paragraph
     para2._element.getparent().remove(para2._element)
@@ -1614,7 +2437,7 @@ async def merge_paragraphs(query1: str, query2: str, separator: str = " ", thres
     return {
         "status": "success",
         "message": f"Merged paragraphs {idx1} and {idx2}",
-        "merged_text": para1.text[:150] + "..." if len(para1.text) > 150 else para1.text
+        "merged_text": truncate_text(para1.text, 150)
     }
 
 
@@ -1631,28 +2454,26 @@ async def get_document_outline() -> dict:
     """
     doc = get_document()
     outline = []
+    index = get_paragraph_index(doc)
 
-    for idx, para in enumerate(doc.paragraphs):
-        if para.style and para.style.name.startswith('Heading'):
-            # Extract heading level
-            try:
-                level = int(para.style.name.replace('Heading ', ''))
-            except ValueError:
-                level = 0
+    for idx, style_name in enumerate(index.styles):
+        if not style_name:
+            continue
+        if style_name.startswith('Heading'):
+            level = parse_heading_level(style_name) or 0
+        elif style_name == 'Title':
+            level = 0
+        else:
+            continue
 
-            outline.append({
-                "id": f"para-{idx}",
-                "level": level,
-                "text": para.text[:100] + "..." if len(para.text) > 100 else para.text,
-                "style": para.style.name
-            })
-        elif para.style and para.style.name == 'Title':
-            outline.append({
-                "id": f"para-{idx}",
-                "level": 0,
-                "text": para.text[:100] + "..." if len(para.text) > 100 else para.text,
-                "style": "Title"
-            })
+        # Only headings need their full (unstripped) text
+        text = paragraph_xml_text(index.paragraphs[idx]._p)
+        outline.append({
+            "id": f"para-{idx}",
+            "level": level,
+            "text": truncate_text(text),
+            "style": style_name
+        })
 
     return {
         "total_headings": len(outline),
@@ -1667,7 +2488,8 @@ async def get_document_stats() -> dict:
     """
     doc = get_document()
 
-    total_paragraphs = 0
+    index = get_paragraph_index(doc)
+    total_paragraphs = len(index.paragraphs)
     non_empty_paragraphs = 0
     total_words = 0
     total_characters = 0
@@ -1675,28 +2497,23 @@ async def get_document_stats() -> dict:
     total_tables = len(doc.tables)
     total_images = 0
 
-    for para in doc.paragraphs:
-        total_paragraphs += 1
-        text = para.text.strip()
+    # Text counts and images in a single pass over the cached paragraphs
+    for para, text in zip(index.paragraphs, index.texts):
         if text:
             non_empty_paragraphs += 1
-            words = text.split()
-            total_words += len(words)
+            total_words += len(text.split())
             total_characters += len(text)
-            total_characters_no_spaces += len(text.replace(' ', ''))
+            total_characters_no_spaces += len(text) - text.count(' ')
 
-    # Count images (inline shapes)
-    for para in doc.paragraphs:
-        for run in para.runs:
-            if run._element.xpath('.//a:blip'):
-                total_images += 1
+        # Count images (runs holding an inline shape)
+        total_images += int(_IMAGE_RUN_COUNT_XPATH(para._p))
 
-    # Count table cells content
+    # Count table cells content (merged cells count once per grid column, like row.cells)
     table_words = 0
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                table_words += len(cell.text.split())
+    for tbl in doc.element.body.iterchildren(qn('w:tbl')):
+        for row in table_text_grid(tbl):
+            for text in row:
+                table_words += len(text.split())
 
     return {
         "paragraphs": {
@@ -1716,6 +2533,7 @@ async def get_document_stats() -> dict:
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def insert_page_break(query: str = None, threshold: float = 0.5) -> dict:
     """
     Insert a page break in the document.
@@ -1747,7 +2565,7 @@ async def insert_page_break(query: str = None, threshold: float = 0.5) -> dict:
         return {
             "status": "success",
             "message": f"Page break inserted after paragraph {idx}",
-            "after_text": para.text[:100] + "..." if len(para.text) > 100 else para.text
+            "after_text": truncate_text(para.text)
         }
     else:
         # Add page break at the end
@@ -1764,6 +2582,7 @@ async def insert_page_break(query: str = None, threshold: float = 0.5) -> dict:
 
 
 @mcp.tool()
+@editing_tool
 async def insert_image(
     image_path: str,
     query: str = None,
@@ -1816,7 +2635,7 @@ async def insert_image(
             "status": "success",
             "message": f"Image inserted after paragraph {idx}",
             "image": os.path.basename(image_path),
-            "after_text": para.text[:100] + "..." if len(para.text) > 100 else para.text
+            "after_text": truncate_text(para.text)
         }
     else:
         # Add image at the end
@@ -1836,6 +2655,7 @@ async def insert_image(
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def create_list(
     items: list,
     list_type: str = "bullet",
@@ -1855,6 +2675,9 @@ async def create_list(
     if not items:
         return {"error": "No items provided for the list"}
 
+    # JSON clients often send numbers; coerce up front so no item can fail halfway through
+    items = ["" if item is None else str(item) for item in items]
+
     doc = get_document()
 
     insert_after_para = None
@@ -1885,30 +2708,30 @@ async def create_list(
         else:
             numId.val = 1
 
-    # Create list items
-    created_paragraphs = []
+    # Create the first item through python-docx so the style and numbering are resolved once
+    first = doc.add_paragraph(items[0])
     # Use "List Paragraph" as base style for font consistency
-    style_name = "List Paragraph" 
-    
-    for item in items:
-        para = doc.add_paragraph(item)
-        
-        # 1. Apply Style (for font/spacing)
-        try:
-            para.style = style_name
-        except KeyError:
-            pass
-            
-        # 2. Apply XML Numbering (for actual numbers/bullets)
-        is_num = list_type.lower() in ["number", "numbered", "ordered"]
-        set_list_xml(para, is_numbered=is_num)
-
-        created_paragraphs.append(para)
+    try:
+        first.style = "List Paragraph"
+    except KeyError:
+        pass
+    # Apply XML Numbering (for actual numbers/bullets)
+    set_list_xml(first, is_numbered=list_type.lower() in ["number", "numbered", "ordered"])
 
-    # Move paragraphs to correct position if query was provided
+    # Move it to the correct position if query was provided
     if insert_after_para:
-        for para in reversed(created_paragraphs):
-            insert_after_para._element.addnext(para._element)
+        insert_after_para._element.addnext(first._element)
+
+    # Chain the remaining items after it, each with a copy of the first item's properties
+    previous = first._element
+    pPr = first._element.pPr
+    for item in items[1:]:
+        p = OxmlElement('w:p')
+        p.append(copy.deepcopy(pPr))
+        previous.addnext(p)
+        if item:
+            Paragraph(p, first._parent).add_run(item)
+        previous = p
 
     save_document(doc)
 
@@ -1921,6 +2744,7 @@ async def create_list(
 
 
 @mcp.tool()
+@editing_tool
 async def add_list_item(
     query: str,
     text: str,
@@ -1974,6 +2798,7 @@ async def add_list_item(
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def clear_formatting(query: str, threshold: float = 0.5) -> dict:
     """
     Remove ALL formatting from a paragraph, resetting it to plain text with Normal style.
@@ -2013,7 +2838,7 @@ async def clear_formatting(query: str, threshold: float = 0.5) -> dict:
     return {
         "status": "success",
         "message": f"Cleared all formatting from paragraph {idx}",
-        "text": para.text[:100] + "..." if len(para.text) > 100 else para.text
+        "text": truncate_text(para.text)
     }
 
 
@@ -2031,21 +2856,15 @@ def add_hyperlink(paragraph, url, text):
     r_id = part.relate_to(url, 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink', is_external=True)
 
     # Create the hyperlink element
-    hyperlink = OxmlElement('w:hyperlink')
-    hyperlink.set(qn('r:id'), r_id)
+    hyperlink = OxmlElement('w:hyperlink', {qn('r:id'): r_id})
 
     # Create a new run for the hyperlink text
     new_run = OxmlElement('w:r')
     rPr = OxmlElement('w:rPr')
 
     # Add hyperlink styling (blue and underlined)
-    color = OxmlElement('w:color')
-    color.set(qn('w:val'), '0000FF')
-    rPr.append(color)
-
-    u = OxmlElement('w:u')
-    u.set(qn('w:val'), 'single')
-    rPr.append(u)
+    rPr.append(OxmlElement('w:color', {qn('w:val'): '0000FF'}))
+    rPr.append(OxmlElement('w:u', {qn('w:val'): 'single'}))
 
     new_run.append(rPr)
 
@@ -2061,6 +2880,7 @@ def add_hyperlink(paragraph, url, text):
 
 
 @mcp.tool()
+@editing_tool
 async def insert_hyperlink(
     url: str,
     display_text: str,
@@ -2113,6 +2933,7 @@ async def insert_hyperlink(
 
 
 @mcp.tool()
+@editing_tool
 async def insert_bookmark(query: str, bookmark_name: str, threshold: float = 0.5) -> dict:
     """
     Insert a bookmark at a specific paragraph location.
@@ -2132,16 +2953,12 @@ async def insert_bookmark(query: str, bookmark_name: str, threshold: float = 0.5
     idx, para, score = match
 
     # Clean bookmark name (remove spaces, special characters)
-    clean_name = re.sub(r'[^a-zA-Z0-9_]', '_', bookmark_name)
-
-    # Create bookmark start element
-    bookmark_start = OxmlElement('w:bookmarkStart')
-    bookmark_start.set(qn('w:id'), str(idx))  # Use paragraph index as bookmark ID
-    bookmark_start.set(qn('w:name'), clean_name)
+    clean_name = _BOOKMARK_INVALID_RE.sub('_', bookmark_name)
 
-    # Create bookmark end element
-    bookmark_end = OxmlElement('w:bookmarkEnd')
-    bookmark_end.set(qn('w:id'), str(idx))
+    # Create bookmark start and end elements (use paragraph index as bookmark ID)
+    bookmark_id = str(idx)
+    bookmark_start = OxmlElement('w:bookmarkStart', {qn('w:id'): bookmark_id, qn('w:name'): clean_name})
+    bookmark_end = OxmlElement('w:bookmarkEnd', {qn('w:id'): bookmark_id})
 
     # Insert bookmark around paragraph content
     para._p.insert(0, bookmark_start)
@@ -2153,7 +2970,7 @@ async def insert_bookmark(query: str, bookmark_name: str, threshold: float = 0.5
         "status": "success",
         "message": f"Bookmark '{clean_name}' added to paragraph {idx}",
         "bookmark_name": clean_name,
-        "paragraph_text": para.text[:100] + "..." if len(para.text) > 100 else para.text
+        "paragraph_text": truncate_text(para.text)
     }
 
 
@@ -2161,6 +2978,54 @@ async def insert_bookmark(query: str, bookmark_name: str, threshold: float = 0.5
 # Header & Footer Tools
 # ============================================
 
+def header_footer_element(header_footer):
+    """
+    Get the <w:hdr>/<w:ftr> element a section's header or footer shows, or None if there is none.
+    Follows the inherited definition instead of adding an empty one, as .paragraphs would,
+    so read-only tools never leave a new header/footer part behind in the cached document.
+    """
+    while header_footer is not None and not header_footer._has_definition:
+        header_footer = header_footer._prior_headerfooter
+    if header_footer is None:
+        return None
+    return header_footer._definition.element
+
+
+def header_footer_paragraph_texts(header_footer) -> list:
+    """Get the text of each paragraph of a header or footer without creating one."""
+    element = header_footer_element(header_footer)
+    if element is None:
+        return []
+    return [paragraph_xml_text(p) for p in element.iterchildren(qn('w:p'))]
+
+
+def header_footer_has_text(header_footer) -> bool:
+    """Check whether a header or footer (or the one it inherits) has any paragraph text."""
+    return any(header_footer_paragraph_texts(header_footer))
+
+
+def set_header_footer_text(header_footer, text: str, alignment: str):
+    """
+    Replace the text of a header or footer with a single aligned paragraph of text.
+    Extra paragraphs are emptied rather than removed, so their formatting stays in place.
+    """
+    paragraphs = header_footer.paragraphs
+    if paragraphs:
+        para = paragraphs[0]
+        # The text setter below clears the first paragraph itself
+        for other in paragraphs[1:]:
+            other.clear()
+    else:
+        para = header_footer.add_paragraph()
+
+    para.text = text
+
+    # Apply alignment
+    align = _ALIGNMENT_MAP.get(alignment.lower())
+    if align is not None:
+        para.alignment = align
+
+
 @mcp.tool()
 async def get_header(section_index: int = 0) -> dict:
     """
@@ -2174,24 +3039,20 @@ async def get_header(section_index: int = 0) -> dict:
     if section_index >= len(doc.sections):
         return {"error": f"Section {section_index} not found. Document has {len(doc.sections)} section(s)."}
 
-    section = doc.sections[section_index]
-    header = section.header
-
-    # Get all paragraphs in header
-    header_text = []
-    for para in header.paragraphs:
-        if para.text.strip():
-            header_text.append(para.text)
+    # Read the header without adding an empty one to a document that has none
+    paragraph_texts = header_footer_paragraph_texts(doc.sections[section_index].header)
+    header_text = [text for text in paragraph_texts if text.strip()]
 
     return {
         "section_index": section_index,
         "has_header": len(header_text) > 0,
         "header_text": "\n".join(header_text) if header_text else "(empty)",
-        "paragraphs": len(header.paragraphs)
+        "paragraphs": len(paragraph_texts)
     }
 
 
 @mcp.tool()
+@editing_tool
 async def set_header(
     text: str,
     section_index: int = 0,
@@ -2207,32 +3068,11 @@ async def set_header(
     """
     doc = get_document()
 
-    if section_index >= len(doc.sections):
-        return {"error": f"Section {section_index} not found. Document has {len(doc.sections)} section(s)."}
-
-    section = doc.sections[section_index]
-    header = section.header
-
-    # Clear existing header content
-    for para in header.paragraphs:
-        para.clear()
+    sections = doc.sections
+    if section_index >= len(sections):
+        return {"error": f"Section {section_index} not found. Document has {len(sections)} section(s)."}
 
-    # Add new header text
-    if header.paragraphs:
-        para = header.paragraphs[0]
-    else:
-        para = header.add_paragraph()
-
-    para.text = text
-
-    # Apply alignment
-    alignment_map = {
-        "left": WD_ALIGN_PARAGRAPH.LEFT,
-        "center": WD_ALIGN_PARAGRAPH.CENTER,
-        "right": WD_ALIGN_PARAGRAPH.RIGHT
-    }
-    if alignment.lower() in alignment_map:
-        para.alignment = alignment_map[alignment.lower()]
+    set_header_footer_text(sections[section_index].header, text, alignment)
 
     save_document(doc)
 
@@ -2256,24 +3096,20 @@ async def get_footer(section_index: int = 0) -> dict:
     if section_index >= len(doc.sections):
         return {"error": f"Section {section_index} not found. Document has {len(doc.sections)} section(s)."}
 
-    section = doc.sections[section_index]
-    footer = section.footer
-
-    # Get all paragraphs in footer
-    footer_text = []
-    for para in footer.paragraphs:
-        if para.text.strip():
-            footer_text.append(para.text)
+    # Read the footer without adding an empty one to a document that has none
+    paragraph_texts = header_footer_paragraph_texts(doc.sections[section_index].footer)
+    footer_text = [text for text in paragraph_texts if text.strip()]
 
     return {
         "section_index": section_index,
         "has_footer": len(footer_text) > 0,
         "footer_text": "\n".join(footer_text) if footer_text else "(empty)",
-        "paragraphs": len(footer.paragraphs)
+        "paragraphs": len(paragraph_texts)
     }
 
 
 @mcp.tool()
+@editing_tool
 async def set_footer(
     text: str,
     section_index: int = 0,
@@ -2289,32 +3125,11 @@ async def set_footer(
     """
     doc = get_document()
 
-    if section_index >= len(doc.sections):
-        return {"error": f"Section {section_index} not found. Document has {len(doc.sections)} section(s)."}
-
-    section = doc.sections[section_index]
-    footer = section.footer
-
-    # Clear existing footer content
-    for para in footer.paragraphs:
-        para.clear()
-
-    # Add new footer text
-    if footer.paragraphs:
-        para = footer.paragraphs[0]
-    else:
-        para = footer.add_paragraph()
-
-    para.text = text
+    sections = doc.sections
+    if section_index >= len(sections):
+        return {"error": f"Section {section_index} not found. Document has {len(sections)} section(s)."}
 
-    # Apply alignment
-    alignment_map = {
-        "left": WD_ALIGN_PARAGRAPH.LEFT,
-        "center": WD_ALIGN_PARAGRAPH.CENTER,
-        "right": WD_ALIGN_PARAGRAPH.RIGHT
-    }
-    if alignment.lower() in alignment_map:
-        para.alignment = alignment_map[alignment.lower()]
+    set_header_footer_text(sections[section_index].footer, text, alignment)
 
     save_document(doc)
 
@@ -2351,6 +3166,7 @@ async def get_document_properties() -> dict:
 
 
 @mcp.tool()
+@editing_tool
 async def set_document_properties(
     title: str = None,
     author: str = None,
@@ -2412,6 +3228,7 @@ async def set_document_properties(
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def add_table_column(
     table_index: int,
     column_data: list = None,
@@ -2426,13 +3243,13 @@ async def add_table_column(
         position: Optional column position (0-indexed). If not provided, adds at the end.
     """
     doc = get_document()
+    tables = doc.tables
 
-    if table_index < 0 or table_index >= len(doc.tables):
-        return {"error": f"Table index {table_index} not found. Document has {len(doc.tables)} table(s)."}
+    if table_index < 0 or table_index >= len(tables):
+        return {"error": f"Table index {table_index} not found. Document has {len(tables)} table(s)."}
 
-    table = doc.tables[table_index]
-    num_rows = len(table.rows)
-    num_cols = len(table.columns)
+    tbl = tables[table_index]._tbl
+    num_cols = len(tbl.tblGrid.gridCol_lst)
 
     # Determine insertion position
     if position is None:
@@ -2440,40 +3257,29 @@ async def add_table_column(
     elif position < 0 or position > num_cols:
         position = num_cols
 
+    # Build the empty cell once, then clone it for each row
+    prototype = OxmlElement('w:tc')
+    tcPr = OxmlElement('w:tcPr')
+    tcPr.append(OxmlElement('w:tcW', {qn('w:w'): '0', qn('w:type'): 'auto'}))
+    prototype.append(tcPr)
+    prototype.append(OxmlElement('w:p'))
+
     # Add a cell to each row
-    for row_idx, row in enumerate(table.rows):
-        # Create a new cell element
-        new_cell = OxmlElement('w:tc')
-
-        # Add cell properties
-        tcPr = OxmlElement('w:tcPr')
-        tcW = OxmlElement('w:tcW')
-        tcW.set(qn('w:w'), '0')
-        tcW.set(qn('w:type'), 'auto')
-        tcPr.append(tcW)
-        new_cell.append(tcPr)
-
-        # Add paragraph to cell
-        p = OxmlElement('w:p')
-        new_cell.append(p)
+    for row_idx, tr in enumerate(tbl.tr_lst):
+        new_cell = copy.deepcopy(prototype)
+
+        # Fill the cell's paragraph with this row's value if provided
+        if column_data and row_idx < len(column_data):
+            r = OxmlElement('w:r')
+            new_cell[-1].append(r)
+            r.text = str(column_data[row_idx])
 
         # Insert at the correct position
-        cells = row._tr.findall(qn('w:tc'))
+        cells = tr.tc_lst
         if position < len(cells):
             cells[position].addprevious(new_cell)
         else:
-            row._tr.append(new_cell)
-
-    # Reload the table to get proper cell references
-    table = doc.tables[table_index]
-
-    # Fill in data if provided
-    if column_data:
-        for row_idx, value in enumerate(column_data):
-            if row_idx < len(table.rows):
-                row = table.rows[row_idx]
-                if position < len(row.cells):
-                    row.cells[position].text = str(value)
+            tr.append(new_cell)
 
     save_document(doc)
 
@@ -2485,6 +3291,7 @@ async def add_table_column(
 
 
 @mcp.tool()
+@editing_tool
 async def delete_table_column(table_index: int, column: int) -> dict:
     """
     Delete a column from a table.
@@ -2494,27 +3301,27 @@ async def delete_table_column(table_index: int, column: int) -> dict:
         column: The column index to delete (starting at 0)
     """
     doc = get_document()
+    tables = doc.tables
 
-    if table_index < 0 or table_index >= len(doc.tables):
-        return {"error": f"Table index {table_index} not found. Document has {len(doc.tables)} table(s)."}
+    if table_index < 0 or table_index >= len(tables):
+        return {"error": f"Table index {table_index} not found. Document has {len(tables)} table(s)."}
 
-    table = doc.tables[table_index]
+    table = tables[table_index]
+    num_cols = len(table._tbl.tblGrid.gridCol_lst)
 
-    if column < 0 or column >= len(table.columns):
-        return {"error": f"Column index {column} out of range. Table has {len(table.columns)} columns."}
+    if column < 0 or column >= num_cols:
+        return {"error": f"Column index {column} out of range. Table has {num_cols} columns."}
 
-    # Delete the cell at the specified column in each row
-    for row in table.rows:
-        cells = row._tr.findall(qn('w:tc'))
-        if column < len(cells):
-            row._tr.remove(cells[column])
+    # Delete the cell at the specified column in each row (rows too short are skipped)
+    for tc in _TABLE_NTH_CELLS_XPATH(table._tbl, n=column + 1):
+        tc.getparent().remove(tc)
 
     save_document(doc)
 
     return {
         "status": "success",
         "message": f"Deleted column {column} from table {table_index}",
-        "remaining_columns": len(table.columns) - 1
+        "remaining_columns": num_cols - 1
     }
 
 
@@ -2538,8 +3345,11 @@ async def create_document(filename: str, title: str = None, switch_to: bool = Tr
     if not filename.endswith('.docx'):
         filename += '.docx'
 
+    # Normalise the path once; it is reused for the existence check, the save and the result
+    full_path = os.path.abspath(filename)
+
     # Check if file already exists
-    if os.path.exists(filename):
+    if os.path.exists(full_path):
         return {"error": f"File '{filename}' already exists. Use a different name or delete the existing file."}
 
     # Create new document
@@ -2551,16 +3361,17 @@ async def create_document(filename: str, title: str = None, switch_to: bool = Tr
         para.style = 'Title'
 
     # Save the document
-    doc.save(filename)
+    doc.save(full_path)
 
     # Switch to the new document if requested
     if switch_to:
+        flush_pending_save()
         CURRENT_DOCX_PATH = filename
 
     return {
         "status": "success",
         "message": f"Created new document: {filename}",
-        "path": os.path.abspath(filename),
+        "path": full_path,
         "switched_to": switch_to
     }
 
@@ -2570,6 +3381,7 @@ async def create_document(filename: str, title: str = None, switch_to: bool = Tr
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def delete_table(table_index: int) -> dict:
     """
     Delete an entire table from the document.
@@ -2578,15 +3390,16 @@ async def delete_table(table_index: int) -> dict:
         table_index: The index of the table to delete (from list_tables, starting at 0)
     """
     doc = get_document()
+    tables = doc.tables
 
-    if table_index < 0 or table_index >= len(doc.tables):
-        return {"error": f"Table index {table_index} not found. Document has {len(doc.tables)} table(s)."}
+    if table_index < 0 or table_index >= len(tables):
+        return {"error": f"Table index {table_index} not found. Document has {len(tables)} table(s)."}
 
-    table = doc.tables[table_index]
+    table = tables[table_index]
 
     # Get table info before deleting
-    rows = len(table.rows)
-    cols = len(table.columns)
+    rows = len(table._tbl.tr_lst)
+    cols = len(table._tbl.tblGrid.gridCol_lst)
 
     # Delete the table using XML manipulation
     table._element.getparent().remove(table._element)
@@ -2596,11 +3409,12 @@ async def delete_table(table_index: int) -> dict:
     return {
         "status": "success",
         "message": f"Deleted table {table_index} ({rows}x{cols})",
-        "remaining_tables": len(doc.tables) - 1
+        "remaining_tables": len(tables) - 1
     }
 
 
 @mcp.tool()
+@editing_tool
 async def merge_table_cells(
     table_index: int,
     start_row: int,
@@ -2619,23 +3433,28 @@ async def merge_table_cells(
         end_col: Ending column index (0-indexed, inclusive)
     """
     doc = get_document()
+    tables = doc.tables
+
+    if table_index < 0 or table_index >= len(tables):
+        return {"error": f"Table index {table_index} not found. Document has {len(tables)} table(s)."}
 
-    if table_index < 0 or table_index >= len(doc.tables):
-        return {"error": f"Table index {table_index} not found. Document has {len(doc.tables)} table(s)."}
+    table = tables[table_index]
 
-    table = doc.tables[table_index]
+    rows = table.rows
+    num_rows = len(table._tbl.tr_lst)
+    num_cols = len(table._tbl.tblGrid.gridCol_lst)
 
     # Validate indices
-    if start_row < 0 or end_row >= len(table.rows):
-        return {"error": f"Row indices out of range. Table has {len(table.rows)} rows."}
-    if start_col < 0 or end_col >= len(table.columns):
-        return {"error": f"Column indices out of range. Table has {len(table.columns)} columns."}
+    if start_row < 0 or end_row >= num_rows:
+        return {"error": f"Row indices out of range. Table has {num_rows} rows."}
+    if start_col < 0 or end_col >= num_cols:
+        return {"error": f"Column indices out of range. Table has {num_cols} columns."}
     if start_row > end_row or start_col > end_col:
         return {"error": "Start indices must be less than or equal to end indices."}
 
     # Get the cells to merge
-    start_cell = table.rows[start_row].cells[start_col]
-    end_cell = table.rows[end_row].cells[end_col]
+    start_cell = rows[start_row].cells[start_col]
+    end_cell = rows[end_row].cells[end_col]
 
     # Merge the cells
     start_cell.merge(end_cell)
@@ -2653,6 +3472,7 @@ async def merge_table_cells(
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def duplicate_paragraph(
     query: str,
     target_query: str = None,
@@ -2688,47 +3508,42 @@ async def duplicate_paragraph(
         target_para = source_para
         position = "after"
 
-    # Create a copy of the paragraph
-    new_para = doc.add_paragraph()
-
-    # Copy the text and formatting
-    for run in source_para.runs:
-        new_run = new_para.add_run(run.text)
-        new_run.bold = run.bold
-        new_run.italic = run.italic
-        new_run.underline = run.underline
-        if run.font.size:
-            new_run.font.size = run.font.size
-        if run.font.name:
-            new_run.font.name = run.font.name
-
-    # Copy paragraph style
-    if source_para.style:
-        try:
-            new_para.style = source_para.style
-        except:
-            pass
+    # Copy the paragraph element with all its runs and formatting in one go
+    new_p = copy.deepcopy(source_para._element)
 
-    # Copy alignment
-    if source_para.alignment:
-        new_para.alignment = source_para.alignment
+    # Bookmarks, comment/footnote anchors and section breaks must stay unique, so the copy doesn't carry them
+    for elem in new_p.xpath(
+        './/w:bookmarkStart | .//w:bookmarkEnd | .//w:commentRangeStart | .//w:commentRangeEnd'
+        ' | .//w:commentReference | .//w:footnoteReference | .//w:endnoteReference | ./w:pPr/w:sectPr'
+    ):
+        elem.getparent().remove(elem)
 
-    # Move to correct position
+    # Word's paragraph ids must be unique too; Word assigns new ones when they are missing
+    for p in new_p.iter(qn('w:p')):
+        p.attrib.pop(qn('w14:paraId'), None)
+        p.attrib.pop(qn('w14:textId'), None)
+
+    # Insert it at the correct position
     if position.lower() == "before":
-        target_para._element.addprevious(new_para._element)
+        target_para._element.addprevious(new_p)
     else:
-        target_para._element.addnext(new_para._element)
+        target_para._element.addnext(new_p)
+
+    # Give copied pictures fresh drawing ids (next_id sees the copy, so each id is new)
+    for doc_pr in new_p.iter(qn('wp:docPr')):
+        doc_pr.set('id', str(doc.part.next_id))
 
     save_document(doc)
 
     return {
         "status": "success",
         "message": f"Duplicated paragraph {position} target",
-        "duplicated_text": source_para.text[:100] + "..." if len(source_para.text) > 100 else source_para.text
+        "duplicated_text": truncate_text(source_para.text)
     }
 
 
 @mcp.tool()
+@editing_tool
 async def copy_formatting(source_id: str, target_id: str) -> dict:
     """
     Copy formatting from one paragraph to another.
@@ -2752,14 +3567,16 @@ async def copy_formatting(source_id: str, target_id: str) -> dict:
     source_idx = parse_id(source_id)
     target_idx = parse_id(target_id)
 
-    if source_idx is None or source_idx < 0 or source_idx >= len(doc.paragraphs):
+    paragraphs = get_paragraph_index(doc).paragraphs
+
+    if source_idx is None or source_idx < 0 or source_idx >= len(paragraphs):
         return {"error": f"Source paragraph {source_id} not found"}
     
-    if target_idx is None or target_idx < 0 or target_idx >= len(doc.paragraphs):
+    if target_idx is None or target_idx < 0 or target_idx >= len(paragraphs):
         return {"error": f"Target paragraph {target_id} not found"}
 
-    source_para = doc.paragraphs[source_idx]
-    target_para = doc.paragraphs[target_idx]
+    source_para = paragraphs[source_idx]
+    target_para = paragraphs[target_idx]
 
     # 1. Copy Paragraph Style
     if source_para.style:
@@ -2814,6 +3631,7 @@ async def copy_formatting(source_id: str, target_id: str) -> dict:
 
 
 @mcp.tool()
+@editing_tool
 async def apply_list_numbering(start_id: str, count: int = 1, list_type: str = "number") -> dict:
     """
     Apply numbered/bullet formatting to a range of existing paragraphs.
@@ -2833,13 +3651,14 @@ async def apply_list_numbering(start_id: str, count: int = 1, list_type: str = "
             return -1
 
     start_idx = get_index(start_id)
-    if start_idx == -1 or start_idx >= len(doc.paragraphs):
+    paragraphs = get_paragraph_index(doc).paragraphs
+    if start_idx == -1 or start_idx >= len(paragraphs):
          return {"error": f"Invalid start_id {start_id}"}
     
     markup_applied = 0
     for i in range(start_idx, start_idx + count):
-        if i >= len(doc.paragraphs): break
-        para = doc.paragraphs[i]
+        if i >= len(paragraphs): break
+        para = paragraphs[i]
         
         # Apply XML properties directly using python-docx oxml access
         # This bypasses style limitations
@@ -2861,6 +3680,7 @@ async def apply_list_numbering(start_id: str, count: int = 1, list_type: str = "
 
 
 @mcp.tool()
+@editing_tool
 async def split_paragraph(query: str, split_at: str, threshold: float = 0.5) -> dict:
     """
     Split a paragraph into two at a specific text point.
@@ -2888,39 +3708,43 @@ async def split_paragraph(query: str, split_at: str, threshold: float = 0.5) ->
     # Calculate where to split (after the split_at text)
     split_point = split_index + len(split_at)
     first_part = full_text[:split_point]
-    second_part = full_text[split_point:].lstrip()
+    # Skip the whitespace after the split point without copying the tail twice
+    tail_start = _LEADING_WHITESPACE_RE.match(full_text, split_point).end()
+    second_part = full_text[tail_start:]
 
     if not second_part:
         return {"error": "Nothing to split - the split point is at the end of the paragraph."}
 
-    # Update the original paragraph with first part
-    for run in para.runs:
-        run.text = ""
-    if para.runs:
-        para.runs[0].text = first_part
-    else:
-        para.add_run(first_part)
-
-    # Create new paragraph with second part
-    new_para = doc.add_paragraph(second_part)
-
-    # Copy style from original
-    if para.style:
-        try:
-            new_para.style = para.style
-        except:
-            pass
-
-    # Move new paragraph right after original
-    para._element.addnext(new_para._element)
+    # Split the runs themselves so both parts keep their formatting
+    p = para._p
+    tail_idx = split_paragraph_content(p, tail_start)
+    tail_first = p[tail_idx] if tail_idx < len(p) else None
+    head_end = split_paragraph_content(p, split_point)
+
+    # The second split may have shifted the tail, so locate it again
+    tail_idx = p.index(tail_first) if tail_first is not None else len(p)
+    tail = p[tail_idx:]
+
+    # Drop the whitespace between the two parts (zero-length markers stay in the first part)
+    for child in p[head_end:tail_idx]:
+        if paragraph_xml_text([child]):
+            p.remove(child)
+
+    # New paragraph with the same paragraph properties; a section break moves with the end
+    new_p = OxmlElement('w:p')
+    if p.pPr is not None:
+        new_p.append(copy.deepcopy(p.pPr))
+        p.pPr._remove_sectPr()
+    new_p.extend(tail)
+    p.addnext(new_p)
 
     save_document(doc)
 
     return {
         "status": "success",
         "message": f"Split paragraph {idx} at '{split_at}'",
-        "first_part": first_part[:100] + "..." if len(first_part) > 100 else first_part,
-        "second_part": second_part[:100] + "..." if len(second_part) > 100 else second_part
+        "first_part": truncate_text(first_part),
+        "second_part": truncate_text(second_part)
     }
 
 
@@ -2939,31 +3763,33 @@ async def get_styles(style_type: str = "all") -> dict:
     doc = get_document()
     styles_list = []
 
-    type_map = {
-        "paragraph": WD_STYLE_TYPE.PARAGRAPH,
-        "character": WD_STYLE_TYPE.CHARACTER,
-        "table": WD_STYLE_TYPE.TABLE,
-        "list": WD_STYLE_TYPE.LIST
-    }
+    # Resolve the filter once; an unknown type matches nothing
+    target_type = None
+    if style_type != "all":
+        target_type = _STYLE_TYPE_MAP.get(style_type.lower())
+        if target_type is None:
+            return {"total_styles": 0, "filter": style_type, "styles": []}
 
+    type_names = {}  # style type -> display name, built once per type
     for style in doc.styles:
-        # Filter by type if specified
-        if style_type != "all":
-            if style_type.lower() in type_map:
-                if style.type != type_map[style_type.lower()]:
-                    continue
-            else:
-                continue
+        # Filter by type before reading anything else from the style
+        style_kind = style.type
+        if target_type is not None and style_kind != target_type:
+            continue
+
+        if style_kind not in type_names:
+            type_names[style_kind] = str(style_kind).replace("WD_STYLE_TYPE.", "")
 
         style_info = {
             "name": style.name,
-            "type": str(style.type).replace("WD_STYLE_TYPE.", ""),
+            "type": type_names[style_kind],
             "builtin": style.builtin
         }
 
         # Add base style if available
-        if style.base_style:
-            style_info["base_style"] = style.base_style.name
+        base_style = getattr(style, "base_style", None)  # Numbering styles have none
+        if base_style:
+            style_info["base_style"] = base_style.name
 
         styles_list.append(style_info)
 
@@ -2988,20 +3814,23 @@ async def list_bookmarks() -> dict:
     """
     doc = get_document()
     bookmarks = []
-
-    # Find all bookmark start elements in the document
-    for para_idx, para in enumerate(doc.paragraphs):
-        bookmark_starts = para._element.findall('.//w:bookmarkStart', {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'})
-        for bookmark in bookmark_starts:
-            name = bookmark.get(qn('w:name'))
-            bookmark_id = bookmark.get(qn('w:id'))
-            if name and not name.startswith('_'):  # Skip internal bookmarks
-                bookmarks.append({
-                    "name": name,
-                    "id": bookmark_id,
-                    "paragraph_index": para_idx,
-                    "paragraph_preview": para.text[:100] + "..." if len(para.text) > 100 else para.text
-                })
+    body = doc.element.body
+    para_indices = None
+
+    # Find all bookmark start elements in the body paragraphs with one XPath query
+    for bookmark in _PARAGRAPH_BOOKMARK_START_XPATH(body):
+        name = bookmark.get(qn('w:name'))
+        if name and not name.startswith('_'):  # Skip internal bookmarks
+            if para_indices is None:
+                # Raw <w:p> elements in document order; no Paragraph wrappers or text index needed
+                para_indices = {p: idx for idx, p in enumerate(body.iterchildren(qn('w:p')))}
+            p = body_child_of(bookmark, body)
+            bookmarks.append({
+                "name": name,
+                "id": bookmark.get(qn('w:id')),
+                "paragraph_index": para_indices[p],
+                "paragraph_preview": truncate_text(paragraph_xml_text(p))
+            })
 
     return {
         "total_bookmarks": len(bookmarks),
@@ -3016,34 +3845,36 @@ async def list_hyperlinks() -> dict:
     """
     doc = get_document()
     hyperlinks = []
+    body = doc.element.body
+    rels = doc.part.rels
+    para_indices = None
 
-    for para_idx, para in enumerate(doc.paragraphs):
-        # Find hyperlink elements
-        hyperlink_elements = para._element.findall('.//w:hyperlink', {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'})
-
-        for hyperlink in hyperlink_elements:
-            r_id = hyperlink.get(qn('r:id'))
-            anchor = hyperlink.get(qn('w:anchor'))
-
-            # Get the display text
-            text_elements = hyperlink.findall('.//w:t', {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'})
-            display_text = ''.join(t.text for t in text_elements if t.text)
-
-            # Try to get the URL from relationships
-            url = None
-            if r_id:
-                try:
-                    rel = para.part.rels[r_id]
-                    url = rel.target_ref
-                except:
-                    pass
-
-            hyperlinks.append({
-                "display_text": display_text,
-                "url": url or "(internal link)",
-                "anchor": anchor,
-                "paragraph_index": para_idx
-            })
+    # Find all hyperlink elements in the body paragraphs with one XPath query
+    for hyperlink in _PARAGRAPH_HYPERLINK_XPATH(body):
+        if para_indices is None:
+            para_indices = {p: idx for idx, p in enumerate(body.iterchildren(qn('w:p')))}
+
+        r_id = hyperlink.get(qn('r:id'))
+        anchor = hyperlink.get(qn('w:anchor'))
+
+        # Get the display text
+        display_text = ''.join(t.text for t in hyperlink.iter(qn('w:t')) if t.text)
+
+        # Try to get the URL from relationships
+        url = None
+        if r_id:
+            try:
+                rel = rels[r_id]
+                url = rel.target_ref
+            except:
+                pass
+
+        hyperlinks.append({
+            "display_text": display_text,
+            "url": url or "(internal link)",
+            "anchor": anchor,
+            "paragraph_index": para_indices[body_child_of(hyperlink, body)]
+        })
 
     return {
         "total_hyperlinks": len(hyperlinks),
@@ -3052,6 +3883,7 @@ async def list_hyperlinks() -> dict:
 
 
 @mcp.tool()
+@editing_tool
 async def remove_bookmark(bookmark_name: str) -> dict:
     """
     Remove a bookmark from the document.
@@ -3062,27 +3894,21 @@ async def remove_bookmark(bookmark_name: str) -> dict:
     doc = get_document()
     removed = False
 
-    # Find and remove bookmark start and end elements
-    for para in doc.paragraphs:
-        bookmark_starts = para._element.findall('.//w:bookmarkStart', {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'})
-        for bookmark in bookmark_starts:
-            name = bookmark.get(qn('w:name'))
-            if name == bookmark_name:
-                bookmark_id = bookmark.get(qn('w:id'))
-
-                # Remove bookmark start
-                bookmark.getparent().remove(bookmark)
-
-                # Find and remove corresponding bookmark end
-                for p in doc.paragraphs:
-                    bookmark_ends = p._element.findall('.//w:bookmarkEnd', {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'})
-                    for end in bookmark_ends:
-                        if end.get(qn('w:id')) == bookmark_id:
-                            end.getparent().remove(end)
-
-                removed = True
-                break
-        if removed:
+    # Find the first bookmark start with this name, then remove it and its matching end(s)
+    body = doc.element.body
+    for bookmark in _PARAGRAPH_BOOKMARK_START_XPATH(body):
+        if bookmark.get(qn('w:name')) == bookmark_name:
+            bookmark_id = bookmark.get(qn('w:id'))
+
+            # Remove bookmark start
+            bookmark.getparent().remove(bookmark)
+
+            # Find and remove corresponding bookmark end in a single pass
+            for end in _PARAGRAPH_BOOKMARK_END_XPATH(body):
+                if end.get(qn('w:id')) == bookmark_id:
+                    end.getparent().remove(end)
+
+            removed = True
             break
 
     if not removed:
@@ -3097,6 +3923,7 @@ async def remove_bookmark(bookmark_name: str) -> dict:
 
 
 @mcp.tool()
+@editing_tool
 async def remove_hyperlink(query: str, threshold: float = 0.5) -> dict:
     """
     Remove a hyperlink from the document, keeping the display text.
@@ -3115,22 +3942,15 @@ async def remove_hyperlink(query: str, threshold: float = 0.5) -> dict:
     removed_count = 0
 
     # Find and remove hyperlinks in this paragraph
-    hyperlinks = para._element.findall('.//w:hyperlink', {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'})
+    hyperlinks = para._element.findall('.//w:hyperlink', nsmap)
 
     for hyperlink in hyperlinks:
-        # Get all runs inside the hyperlink
-        runs = hyperlink.findall('.//w:r', {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'})
-
-        # Move runs outside the hyperlink
-        parent = hyperlink.getparent()
-        index = list(parent).index(hyperlink)
-
-        for run in runs:
-            parent.insert(index, run)
-            index += 1
+        # Move runs outside the hyperlink, in order, to where it sits
+        for run in hyperlink.findall('.//w:r', nsmap):
+            hyperlink.addprevious(run)
 
         # Remove the empty hyperlink element
-        parent.remove(hyperlink)
+        hyperlink.getparent().remove(hyperlink)
         removed_count += 1
 
     if removed_count == 0:
@@ -3141,7 +3961,7 @@ async def remove_hyperlink(query: str, threshold: float = 0.5) -> dict:
     return {
         "status": "success",
         "message": f"Removed {removed_count} hyperlink(s) from paragraph {idx}",
-        "paragraph_text": para.text[:100] + "..." if len(para.text) > 100 else para.text
+        "paragraph_text": truncate_text(para.text)
     }
 
 
@@ -3150,6 +3970,7 @@ async def remove_hyperlink(query: str, threshold: float = 0.5) -> dict:
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def set_page_margins(
     top: float = None,
     bottom: float = None,
@@ -3170,43 +3991,38 @@ async def set_page_margins(
     """
     doc = get_document()
 
-    if section_index >= len(doc.sections):
-        return {"error": f"Section {section_index} not found. Document has {len(doc.sections)} section(s)."}
-
-    section = doc.sections[section_index]
-    updated = []
+    sections = doc.sections
+    if section_index >= len(sections):
+        return {"error": f"Section {section_index} not found. Document has {len(sections)} section(s)."}
 
-    if top is not None:
-        section.top_margin = Inches(top)
-        updated.append(f"top={top}\"")
-    if bottom is not None:
-        section.bottom_margin = Inches(bottom)
-        updated.append(f"bottom={bottom}\"")
-    if left is not None:
-        section.left_margin = Inches(left)
-        updated.append(f"left={left}\"")
-    if right is not None:
-        section.right_margin = Inches(right)
-        updated.append(f"right={right}\"")
+    margins = {"top": top, "bottom": bottom, "left": left, "right": right}
+    updated = [f"{side}={value}\"" for side, value in margins.items() if value is not None]
 
     if not updated:
         return {"error": "No margins specified to update."}
 
+    # Write every margin on the one <w:pgMar> element instead of looking it up per setter
+    page_margins = sections[section_index]._sectPr.get_or_add_pgMar()
+    for side, value in margins.items():
+        if value is not None:
+            setattr(page_margins, side, Inches(value))
+
     save_document(doc)
 
     return {
         "status": "success",
         "message": f"Updated margins for section {section_index}: {', '.join(updated)}",
         "current_margins": {
-            "top": section.top_margin.inches,
-            "bottom": section.bottom_margin.inches,
-            "left": section.left_margin.inches,
-            "right": section.right_margin.inches
+            "top": page_margins.top.inches,
+            "bottom": page_margins.bottom.inches,
+            "left": page_margins.left.inches,
+            "right": page_margins.right.inches
         }
     }
 
 
 @mcp.tool()
+@editing_tool
 async def set_page_size(
     width: float = None,
     height: float = None,
@@ -3226,10 +4042,11 @@ async def set_page_size(
     """
     doc = get_document()
 
-    if section_index >= len(doc.sections):
-        return {"error": f"Section {section_index} not found. Document has {len(doc.sections)} section(s)."}
+    sections = doc.sections
+    if section_index >= len(sections):
+        return {"error": f"Section {section_index} not found. Document has {len(sections)} section(s)."}
 
-    section = doc.sections[section_index]
+    section = sections[section_index]
 
     # Page size presets (width x height in inches)
     presets = {
@@ -3246,22 +4063,25 @@ async def set_page_size(
             return {"error": f"Unknown preset '{preset}'. Available: {', '.join(presets.keys())}"}
         width, height = presets[preset_lower]
 
-    if width is not None:
-        section.page_width = Inches(width)
-    if height is not None:
-        section.page_height = Inches(height)
+    # Work out the final dimensions first so <w:pgSz> is written once, not once per swap
+    page_size = section._sectPr.get_or_add_pgSz()
+    page_width = Inches(width) if width is not None else page_size.w
+    page_height = Inches(height) if height is not None else page_size.h
 
     if orientation:
         if orientation.lower() == "landscape":
-            section.orientation = WD_ORIENT.LANDSCAPE
+            page_size.orient = WD_ORIENT.LANDSCAPE
             # Swap dimensions if needed
-            if section.page_width < section.page_height:
-                section.page_width, section.page_height = section.page_height, section.page_width
+            if page_width < page_height:
+                page_width, page_height = page_height, page_width
         elif orientation.lower() == "portrait":
-            section.orientation = WD_ORIENT.PORTRAIT
+            page_size.orient = WD_ORIENT.PORTRAIT
             # Swap dimensions if needed
-            if section.page_width > section.page_height:
-                section.page_width, section.page_height = section.page_height, section.page_width
+            if page_width > page_height:
+                page_width, page_height = page_height, page_width
+
+    page_size.w = page_width
+    page_size.h = page_height
 
     save_document(doc)
 
@@ -3269,14 +4089,15 @@ async def set_page_size(
         "status": "success",
         "message": f"Updated page size for section {section_index}",
         "current_size": {
-            "width": round(section.page_width.inches, 2),
-            "height": round(section.page_height.inches, 2),
-            "orientation": "landscape" if section.orientation == WD_ORIENT.LANDSCAPE else "portrait"
+            "width": round(page_size.w.inches, 2),
+            "height": round(page_size.h.inches, 2),
+            "orientation": "landscape" if page_size.orient == WD_ORIENT.LANDSCAPE else "portrait"
         }
     }
 
 
 @mcp.tool()
+@editing_tool
 async def set_paragraph_spacing(
     query: str,
     line_spacing: float = None,
@@ -3301,18 +4122,19 @@ async def set_paragraph_spacing(
         return {"error": f"No paragraph found matching: '{query}'"}
 
     idx, para, score = match
+    paragraph_format = para.paragraph_format  # Built once, not per setting
     updated = []
 
     if line_spacing is not None:
-        para.paragraph_format.line_spacing = line_spacing
+        paragraph_format.line_spacing = line_spacing
         updated.append(f"line_spacing={line_spacing}")
 
     if space_before is not None:
-        para.paragraph_format.space_before = Pt(space_before)
+        paragraph_format.space_before = Pt(space_before)
         updated.append(f"space_before={space_before}pt")
 
     if space_after is not None:
-        para.paragraph_format.space_after = Pt(space_after)
+        paragraph_format.space_after = Pt(space_after)
         updated.append(f"space_after={space_after}pt")
 
     if not updated:
@@ -3323,7 +4145,7 @@ async def set_paragraph_spacing(
     return {
         "status": "success",
         "message": f"Updated spacing for paragraph {idx}: {', '.join(updated)}",
-        "paragraph_text": para.text[:100] + "..." if len(para.text) > 100 else para.text
+        "paragraph_text": truncate_text(para.text)
     }
 
 
@@ -3340,19 +4162,23 @@ async def get_sections() -> dict:
     sections_list = []
 
     for idx, section in enumerate(doc.sections):
+        # Look up <w:pgSz> and <w:pgMar> once each instead of once per property
+        sectPr = section._sectPr
+        page_size = sectPr.pgSz
+        page_margins = sectPr.pgMar
         section_info = {
             "index": idx,
-            "page_width": round(section.page_width.inches, 2),
-            "page_height": round(section.page_height.inches, 2),
-            "orientation": "landscape" if section.orientation == WD_ORIENT.LANDSCAPE else "portrait",
+            "page_width": round(page_size.w.inches, 2),
+            "page_height": round(page_size.h.inches, 2),
+            "orientation": "landscape" if page_size.orient == WD_ORIENT.LANDSCAPE else "portrait",
             "margins": {
-                "top": round(section.top_margin.inches, 2),
-                "bottom": round(section.bottom_margin.inches, 2),
-                "left": round(section.left_margin.inches, 2),
-                "right": round(section.right_margin.inches, 2)
+                "top": round(page_margins.top.inches, 2),
+                "bottom": round(page_margins.bottom.inches, 2),
+                "left": round(page_margins.left.inches, 2),
+                "right": round(page_margins.right.inches, 2)
             },
-            "has_header": bool(section.header.paragraphs and any(p.text for p in section.header.paragraphs)),
-            "has_footer": bool(section.footer.paragraphs and any(p.text for p in section.footer.paragraphs))
+            "has_header": header_footer_has_text(section.header),
+            "has_footer": header_footer_has_text(section.footer)
         }
         sections_list.append(section_info)
 
@@ -3363,6 +4189,7 @@ async def get_sections() -> dict:
 
 
 @mcp.tool()
+@editing_tool
 async def add_section_break(
     query: str = None,
     break_type: str = "next_page",
@@ -3423,6 +4250,7 @@ async def add_section_break(
 
 
 @mcp.tool()
+@editing_tool
 async def insert_line_break(query: str, after_text: str = None, threshold: float = 0.5) -> dict:
     """
     Insert a soft line break (Shift+Enter) within a paragraph.
@@ -3474,7 +4302,7 @@ async def insert_line_break(query: str, after_text: str = None, threshold: float
     return {
         "status": "success",
         "message": f"Line break inserted in paragraph {idx}",
-        "paragraph_text": para.text[:100] + "..." if len(para.text) > 100 else para.text
+        "paragraph_text": truncate_text(para.text)
     }
 
 
@@ -3483,6 +4311,7 @@ async def insert_line_break(query: str, after_text: str = None, threshold: float
 # ============================================
 
 @mcp.tool()
+@editing_tool
 async def delete_image(query: str, image_index: int = 0, threshold: float = 0.5) -> dict:
     """
     Delete an image from the document.
@@ -3500,12 +4329,9 @@ async def delete_image(query: str, image_index: int = 0, threshold: float = 0.5)
 
     idx, para, score = match
 
-    # Find images (drawings) in the paragraph
-    images = []
-    for run in para.runs:
-        drawings = run._element.findall('.//a:blip', {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'})
-        if drawings:
-            images.append((run, drawings))
+    # Find the runs holding images (drawings); stop at the first <a:blip> of each run
+    blip = qn('a:blip')
+    images = [r for r in para._p.iterchildren(qn('w:r')) if next(r.iter(blip), None) is not None]
 
     if not images:
         return {"error": "No images found in the matched paragraph."}
@@ -3514,8 +4340,8 @@ async def delete_image(query: str, image_index: int = 0, threshold: float = 0.5)
         return {"error": f"Image index {image_index} out of range. Paragraph has {len(images)} image(s)."}
 
     # Delete the run containing the image
-    run_to_delete, _ = images[image_index]
-    run_to_delete._element.getparent().remove(run_to_delete._element)
+    run_to_delete = images[image_index]
+    run_to_delete.getparent().remove(run_to_delete)
 
     save_document(doc)
 
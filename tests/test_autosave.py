@@ -0,0 +1,110 @@
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import server
+from docx import Document
+from docx.document import Document as DocumentObject
+
+
+class AutosaveTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "test.docx")
+        doc = Document()
+        doc.add_paragraph("Dear <<Name>>")
+        doc.add_paragraph("Hello <<Name>>")
+        doc.save(self.path)
+
+        server.discard_active_document()
+        server._DOC_STATE["autosave"] = True
+        server.CURRENT_DOCX_PATH = self.path
+        self.saves = []
+        real_save = DocumentObject.save
+
+        def counting_save(doc, path):
+            self.saves.append(path)
+            real_save(doc, path)
+
+        patcher = mock.patch.object(DocumentObject, "save", counting_save)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        server.discard_active_document()
+        self.tmp.cleanup()
+
+    def test_burst_of_edits_is_saved_once(self):
+        async def burst():
+            for i in range(5):
+                await server.add_paragraph(text=f"Line {i}")
+            await asyncio.sleep(server.SAVE_DELAY + 0.1)
+
+        asyncio.run(burst())
+        self.assertEqual(self.saves, [self.path])
+        self.assertEqual(len(Document(self.path).paragraphs), 7)
+
+    def test_autosave_off_defers_all_writes_to_flush(self):
+        async def burst():
+            await server.set_autosave(enabled=False)
+            for i in range(5):
+                await server.add_paragraph(text=f"Line {i}")
+            await asyncio.sleep(server.SAVE_DELAY + 0.1)
+            self.assertEqual(self.saves, [])
+            await server.flush_document()
+
+        asyncio.run(burst())
+        self.assertEqual(self.saves, [self.path])
+        self.assertEqual(len(Document(self.path).paragraphs), 7)
+
+    def test_failed_background_save_is_reported(self):
+        def failing_save(doc, path):
+            raise PermissionError("locked")
+
+        async def edits():
+            with mock.patch.object(DocumentObject, "save", failing_save):
+                first = await server.add_paragraph(text="One")
+                await asyncio.sleep(server.SAVE_DELAY + 0.1)
+                second = await server.add_paragraph(text="Two")
+                flushed = await server.flush_document()
+            retried = await server.flush_document()
+            return first, second, flushed, retried
+
+        first, second, flushed, retried = asyncio.run(edits())
+        self.assertNotIn("save_error", first)
+        self.assertIn("PermissionError", second["save_error"])
+        self.assertIn("PermissionError", flushed["error"])
+        self.assertEqual(retried["status"], "success")
+        texts = [p.text for p in Document(self.path).paragraphs]
+        self.assertEqual(texts[-2:], ["One", "Two"])
+
+    def test_failed_tool_rolls_back_unsaved_edits(self):
+        real_replace = server.replace_pattern_in_paragraph
+        calls = []
+
+        def failing_replace(*args):
+            calls.append(args)
+            if len(calls) > 1:
+                raise TypeError("boom")
+            return real_replace(*args)
+
+        async def edits():
+            await server.add_paragraph(text="Kept")
+            with mock.patch.object(server, "replace_pattern_in_paragraph", failing_replace):
+                with self.assertRaises(TypeError):
+                    await server.replace_placeholders(replacements={"<<Name>>": "Alice"})
+            await server.flush_document()
+
+        asyncio.run(edits())
+        texts = [p.text for p in Document(self.path).paragraphs]
+        self.assertEqual(texts, ["Dear <<Name>>", "Hello <<Name>>", "Kept"])
+        self.assertEqual(len(self.saves), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()